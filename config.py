@@ -41,6 +41,10 @@ class TTSConfig:
                 "repo_id": "hexgrad/Kokoro-82M",
                 "repo_version": "main",
                 "default_language": "a",
+                "dtype": "fp32",  # fp32, bf16, fp16 or auto (reduced precision is CUDA-only)
+                "compile": False,  # torch.compile the model on CUDA
+                "quantize": None,  # int8 dynamic quantization; None = on for CPU only
+                "max_concurrency": 2,  # API worker threads; synthesis steps on the shared pipeline still run one at a time
                 "max_generation_time": 300,
                 "min_generation_time": 60,
                 "max_retries": 3,
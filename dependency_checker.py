@@ -6,7 +6,7 @@ This module checks if all required dependencies are installed and compatible.
 
 import sys
 import importlib
-import subprocess
+import importlib.metadata
 from typing import Dict, List, Tuple, Optional
 from packaging import version
 import logging
@@ -65,17 +65,11 @@ class DependencyChecker:
                 if hasattr(module, attr):
                     return getattr(module, attr)
             
-            # For some packages, try getting version via pip
+            # For some packages, read the version from installed distribution metadata
+            # (same data `pip show` reports, without spawning a pip subprocess)
             try:
-                result = subprocess.run(
-                    [sys.executable, '-m', 'pip', 'show', package_name],
-                    capture_output=True, text=True, timeout=10
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        if line.startswith('Version:'):
-                            return line.split(':', 1)[1].strip()
-            except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+                return importlib.metadata.version(package_name)
+            except importlib.metadata.PackageNotFoundError:
                 pass
             
             return "unknown"
@@ -24,7 +24,10 @@ import sys
 import platform
 from datetime import datetime
 import shutil
+import gc
+import threading
 from pathlib import Path
+import psutil
 import soundfile as sf
 from pydub import AudioSegment
 import torch
@@ -33,7 +36,8 @@ import argparse
 from typing import Union, List, Optional, Tuple, Dict, Any
 from models import (
     list_available_voices, build_model,
-    generate_speech, download_voice_files, EnhancedKPipeline
+    generate_speech, download_voice_files, EnhancedKPipeline, DTYPE_CHOICES,
+    audio_to_tensor, SPLIT_PATTERN, VOICES_DIR
 )
 import speed_dial
 
@@ -63,6 +67,9 @@ SAMPLE_RATE = validate_sample_rate(24000)  # Validated sample rate
 
 # Initialize model globally
 device = 'cuda' if torch.cuda.is_available() else 'cpu'
+model_dtype = None  # Inference precision, set from --dtype; None falls back to KOKORO_DTYPE
+compile_model = False  # torch.compile the model, set from --compile
+quantize_model = None  # int8 quantization on CPU, set from --quantize/--no-quantize
 model = None
 
 LANG_MAP = {
@@ -77,6 +84,7 @@ LANG_MAP = {
     "pf_": "p", "pm_": "p",
 }
 pipelines = {}
+pipelines_lock = threading.Lock()  # Serializes pipeline creation across concurrent Gradio requests
 
 def get_available_voices():
     """Get list of available voice models."""
@@ -85,13 +93,14 @@ def get_available_voices():
         global model
         if model is None:
             print("Initializing model and downloading voices...")
-            model = build_model(None, device)
+            model = build_model(None, device, dtype=model_dtype, compile_model=compile_model,
+                                quantize=quantize_model)
 
         voices = list_available_voices()
         if not voices:
             print("No voices found after initialization. Attempting to download...")
             download_voice_files()  # Try downloading again
-            voices = list_available_voices()
+            voices = list_available_voices(force_refresh=True)
 
         print("Available voices:", voices)
         return voices
@@ -105,10 +114,26 @@ def get_pipeline_for_voice(voice_name: str) -> EnhancedKPipeline:
     """
     prefix = voice_name[:3].lower()
     lang_code = LANG_MAP.get(prefix, "a")
-    if lang_code not in pipelines:
-        print(f"[INFO] Creating pipeline for lang_code='{lang_code}'")
-        pipelines[lang_code] = EnhancedKPipeline(lang_code=lang_code, model=True)
-    return pipelines[lang_code]
+    pipeline = pipelines.get(lang_code)
+    if pipeline is not None:
+        return pipeline
+
+    with pipelines_lock:
+        # Double-check so concurrent requests build each language's pipeline only once
+        if lang_code not in pipelines:
+            if model is not None and model.lang_code == lang_code:
+                # The global pipeline already serves this language
+                pipelines[lang_code] = model
+            else:
+                print(f"[INFO] Creating pipeline for lang_code='{lang_code}'")
+                # Share the loaded KModel so each language does not load the checkpoint again
+                shared_model = getattr(model, 'model', None) if model is not None else None
+                pipeline = EnhancedKPipeline(lang_code=lang_code, model=shared_model if shared_model is not None else True)
+                if shared_model is not None:
+                    pipeline.device = model.device
+                    pipeline.dtype = model.dtype
+                pipelines[lang_code] = pipeline
+        return pipelines[lang_code]
 
 def convert_audio(input_path: PathLike, output_path: PathLike, format: str) -> Optional[PathLike]:
     """Convert audio to specified format.
@@ -175,8 +200,6 @@ def generate_tts_with_logs(voice_name: str, text: str, format: str, speed: float
         Path to generated audio file or None on error
     """
     global model
-    import psutil
-    import gc
 
     try:
         # Check available memory before processing
@@ -187,13 +210,14 @@ def generate_tts_with_logs(voice_name: str, text: str, format: str, speed: float
             print(f"Warning: Low memory available ({available_gb:.1f}GB). Consider closing other applications.")
             # Force garbage collection
             gc.collect()
-            if torch.cuda.is_available():
+            if device == 'cuda':
                 torch.cuda.empty_cache()
 
         # Initialize model if needed
         if model is None:
             print("Initializing model...")
-            model = build_model(None, device)
+            model = build_model(None, device, dtype=model_dtype, compile_model=compile_model,
+                                quantize=quantize_model)
 
         # Create output directory
         DEFAULT_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -222,37 +246,54 @@ def generate_tts_with_logs(voice_name: str, text: str, format: str, speed: float
         print(f"Using voice: {voice_name}")
 
         # Validate voice path using Path for consistent handling
-        voice_path = Path("voices").resolve() / f"{voice_name}.pt"
+        voice_path = VOICES_DIR / f"{voice_name}.pt"
         if not voice_path.exists():
             raise FileNotFoundError(f"Voice file not found: {voice_path}")
 
         try:
             if voice_name.startswith(tuple(LANG_MAP.keys())):
                 pipeline = get_pipeline_for_voice(voice_name)
-                generator = pipeline(text, voice=voice_path, speed=speed, split_pattern=r'\n+')
             else:
-                generator = model(text, voice=voice_path, speed=speed, split_pattern=r'\n+')
+                pipeline = model
+
+            # Presets cache their phonemes, so replaying one skips phonemization
+            cached_phonemes = speed_dial.get_cached_phonemes(voice_name, text)
+            if cached_phonemes is not None and hasattr(pipeline, 'generate_from_tokens'):
+                generator = (
+                    result
+                    for ps in cached_phonemes
+                    for result in pipeline.generate_from_tokens(ps, voice=voice_path, speed=speed)
+                )
+            else:
+                cached_phonemes = None
+                generator = pipeline(text, voice=voice_path, speed=speed, split_pattern=SPLIT_PATTERN)
 
             all_audio = []
+            all_phonemes = []
             max_segments = 100  # Safety limit for very long texts
             segment_count = 0
+            truncated = False
 
             for gs, ps, audio in generator:
                 segment_count += 1
                 if segment_count > max_segments:
                     print(f"Warning: Reached maximum segment limit ({max_segments})")
+                    truncated = True
                     break
 
                 if audio is not None:
-                    if isinstance(audio, np.ndarray):
-                        audio = torch.from_numpy(audio).float()
-                    all_audio.append(audio)
+                    all_audio.append(audio_to_tensor(audio))
+                    all_phonemes.append(ps)
                     print(f"Generated segment: {gs}")
                     if ps:  # Only print phonemes if available
                         print(f"Phonemes: {ps}")
 
             if not all_audio:
                 raise Exception("No audio generated")
+
+            # Remember the phonemes on presets using this text for the next playback
+            if cached_phonemes is None and not truncated and all(all_phonemes):
+                speed_dial.store_phonemes(voice_name, text, all_phonemes)
         except Exception as e:
             raise Exception(f"Error in speech generation: {e}")
 
@@ -494,7 +535,7 @@ def cleanup_resources():
                 print(f"Error deleting model: {type(me).__name__}: {me}")
 
         # Clear CUDA memory explicitly
-        if torch.cuda.is_available():
+        if device == 'cuda':
             try:
                 # Get initial memory usage
                 try:
@@ -527,7 +568,6 @@ def cleanup_resources():
 
         # Final garbage collection
         try:
-            import gc
             collected = gc.collect()
             print(f"Garbage collection completed: {collected} objects collected")
         except Exception as gce:
@@ -579,11 +619,32 @@ def parse_arguments():
         default=7860,
         help="Port number to run the server on"
     )
+    parser.add_argument(
+        "--dtype",
+        choices=DTYPE_CHOICES,
+        default=None,
+        help="Model precision on CUDA (auto picks bf16 where supported, else fp16); "
+             "defaults to KOKORO_DTYPE, or fp32 if unset"
+    )
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="Compile the model with torch.compile on CUDA (slower startup, faster generation)"
+    )
+    parser.add_argument(
+        "--quantize",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Use int8 dynamic quantization for CPU inference (on by default for CPU)"
+    )
     return parser.parse_args()
 
 if __name__ == "__main__":
     try:
         args = parse_arguments()
+        model_dtype = args.dtype
+        compile_model = args.compile
+        quantize_model = args.quantize
         create_interface(server_name=args.host, server_port=args.port)
     finally:
         # Ensure cleanup even if Gradio encounters an error
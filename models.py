@@ -1,15 +1,26 @@
 """Models module for Kokoro TTS Local"""
-from typing import Optional, Tuple, List
+from typing import Iterator, Optional, Tuple, List, Union
 import torch
 from kokoro import KPipeline
 import os
 import json
 import codecs
+import pickle
+import functools
+import contextlib
+import importlib.util
+import re
 from pathlib import Path
 import numpy as np
 import shutil
+try:
+    import orjson  # Optional C JSON parser; falls back to the json module
+except ImportError:
+    orjson = None
 import threading
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 # Configure logging
@@ -24,6 +35,15 @@ warnings.filterwarnings("ignore", message="`torch.nn.utils.weight_norm` is depre
 os.environ["PYTHONIOENCODING"] = "utf-8"
 # Disable symlinks warning
 os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
+# Use the Rust hf_transfer backend for multi-connection downloads when it is installed;
+# huggingface_hub errors out if the flag is set without the package
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+# Allow TF32 matmuls on Ampere+ GPUs; no effect on CPU.
+# cudnn.benchmark stays off: token counts change per request, so every new
+# input shape would trigger a fresh autotuning pass.
+torch.set_float32_matmul_precision('high')
 
 # Setup for safer cleanup
 import atexit
@@ -38,30 +58,65 @@ _patches_applied = {
 class EnhancedKPipeline(KPipeline):
     """Enhanced KPipeline with improved voice loading and error handling"""
     
-    def __init__(self, lang_code: str = 'a', model: bool = True):
+    def __init__(self, lang_code: str = 'a', model: Union[bool, torch.nn.Module] = True):
         super().__init__(lang_code=lang_code, model=model)
         self.device = 'cpu'  # Default device
+        self.dtype = torch.float32  # Inference precision, lowered by build_model on CUDA
         if not hasattr(self, 'voices'):
             self.voices = {}
     
-    def load_voice(self, voice_path: str) -> torch.Tensor:
+    def load_voice(self, voice_path: Union[str, torch.Tensor]) -> torch.Tensor:
         """Load voice model with improved error handling and path validation"""
-        voice_path = Path(voice_path).resolve()
-        
+        # Already loaded voice tensors can be passed straight to __call__
+        if isinstance(voice_path, torch.Tensor):
+            return voice_path
+
+        # KPipeline calls load_voice on every generation; reuse already loaded voices
+        voice_name = Path(voice_path).stem
+        if voice_name in self.voices:
+            return self.voices[voice_name]
+
+        # Loads are serialized so the background preload and request threads
+        # never read and upload the same voice twice
+        with _pipeline_lock:
+            if voice_name in self.voices:
+                return self.voices[voice_name]
+            return self._load_voice_file(voice_name, Path(voice_path).resolve())
+
+    def _load_voice_file(self, voice_name: str, voice_path: Path) -> torch.Tensor:
+        """Read a voice pack from disk and move it to the pipeline's device and dtype"""
         if not voice_path.exists():
             raise FileNotFoundError(f"Voice file not found: {voice_path}")
-        
-        voice_name = voice_path.stem
-        
+
         try:
             logger.info(f"Loading voice: {voice_name} from {voice_path}")
-            voice_model = torch.load(str(voice_path), weights_only=True, map_location='cpu')
+            safetensors_path = _ensure_safetensors(voice_path)
+            if safetensors_path is not None:
+                # Header parse + mmap instead of walking a pickle graph
+                from safetensors.torch import load_file
+                voice_model = load_file(str(safetensors_path), device='cpu')[_SAFETENSORS_KEY]
+            else:
+                try:
+                    # Memory-map storages so the file is paged in on demand instead of read up front
+                    voice_model = torch.load(str(voice_path), weights_only=True, map_location='cpu', mmap=True)
+                except (pickle.UnpicklingError, RuntimeError):
+                    # Legacy (non-zipfile) archives cannot be memory-mapped
+                    voice_model = torch.load(str(voice_path), weights_only=True, map_location='cpu')
             
             if voice_model is None:
                 raise ValueError(f"Failed to load voice model from {voice_path}")
             
-            # Move model to device and store in voices dictionary
-            self.voices[voice_name] = voice_model.to(self.device)
+            # Move model to device and precision and store in voices dictionary
+            if str(self.device).startswith('cuda'):
+                # Pinned host memory allows an async copy on a dedicated stream
+                voice_model = voice_model.pin_memory()
+                stream = getattr(self, '_voice_copy_stream', None) or torch.cuda.Stream()
+                self._voice_copy_stream = stream
+                with torch.cuda.stream(stream):
+                    self.voices[voice_name] = voice_model.to(self.device, dtype=self.dtype, non_blocking=True)
+                stream.synchronize()
+            else:
+                self.voices[voice_name] = voice_model.to(self.device, dtype=self.dtype)
             logger.info(f"Successfully loaded voice: {voice_name}")
             return self.voices[voice_name]
             
@@ -78,9 +133,13 @@ def _cleanup_patches() -> None:
             logger.info("Restored original json.load function")
     except Exception as e:
         logger.warning(f"Error restoring json.load: {e}")
+    clear_phonemize_cache()
 
-# Register cleanup for normal exit
-atexit.register(_cleanup_patches)
+# Register cleanup for normal exit only on request: restoring json.load has no
+# observable effect in a process that is about to exit. Long-running hosts that
+# re-import this module should set KOKORO_RESTORE_PATCHES=1.
+if os.environ.get('KOKORO_RESTORE_PATCHES'):
+    atexit.register(_cleanup_patches)
 
 # Register cleanup for signals
 for sig in [signal.SIGINT, signal.SIGTERM]:
@@ -94,8 +153,23 @@ for sig in [signal.SIGINT, signal.SIGTERM]:
         # Some signals might not be available on all platforms
         logger.warning(f"Could not register signal handler: {e}")
 
-# List of available voice files (54 voices across 8 languages)
-VOICE_FILES = [
+# Voices directory resolved once at import time
+VOICES_DIR: Path = Path(os.path.abspath("voices"))
+
+# Paragraph split pattern passed to KPipeline, compiled once instead of per request
+SPLIT_PATTERN = re.compile(r'\n+')
+# Also splits after sentence-final punctuation, for a faster first streamed segment
+_SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?。！？])\s+|\n+')
+
+# Silence inserted between segments when joining multi-segment output (0.1 s at 24 kHz)
+_SEGMENT_GAP_SAMPLES = 2400
+
+# Phoneme chunks whose text-side stages share one padded pass in generate_speech_batch;
+# padding waste and activation memory grow with the spread of lengths in a batch
+_MAX_FORWARD_BATCH = 8
+
+# Set of available voice files (54 voices across 8 languages)
+VOICE_FILES = frozenset({
     # American English Female voices (11 voices)
     "af_heart.pt", "af_alloy.pt", "af_aoede.pt", "af_bella.pt", "af_jessica.pt",
     "af_kore.pt", "af_nicole.pt", "af_nova.pt", "af_river.pt", "af_sarah.pt", "af_sky.pt",
@@ -131,7 +205,7 @@ VOICE_FILES = [
 
     # Brazilian Portuguese voices (3 voices)
     "pf_dora.pt", "pm_alex.pt", "pm_santa.pt"
-]
+})
 
 # Language code mapping for different languages
 LANGUAGE_CODES = {
@@ -146,6 +220,18 @@ LANGUAGE_CODES = {
     'p': 'Brazilian Portuguese'
 }
 
+# Map voice prefixes to language codes
+_VOICE_PREFIX_TO_LANG = {
+    'af': 'a', 'am': 'a',  # American English
+    'bf': 'b', 'bm': 'b',  # British English
+    'jf': 'j', 'jm': 'j',  # Japanese
+    'zf': 'z', 'zm': 'z',  # Mandarin Chinese
+    'ef': 'e', 'em': 'e',  # Spanish
+    'ff': 'f', 'fm': 'f',  # French
+    'hf': 'h', 'hm': 'h',  # Hindi
+    'if': 'i', 'im': 'i',  # Italian
+    'pf': 'p', 'pm': 'p',  # Brazilian Portuguese
+}
 
 def patch_json_load() -> None:
     """Patch json.load to handle UTF-8 encoded files with special characters"""
@@ -155,13 +241,13 @@ def patch_json_load() -> None:
 
     def custom_load(fp, *args, **kwargs):
         try:
-            # Try reading with UTF-8 encoding
+            # Hand raw bytes to the parser when possible; orjson decodes UTF-8 natively
             if hasattr(fp, 'buffer'):
-                content = fp.buffer.read().decode('utf-8')
+                content = fp.buffer.read()
             else:
                 content = fp.read()
             try:
-                return json.loads(content)
+                return _json_loads(content)
             except json.JSONDecodeError as e:
                 logger.error(f"JSON parsing error: {e}")
                 raise
@@ -172,7 +258,7 @@ def patch_json_load() -> None:
             if isinstance(content, bytes):
                 content = content.decode('utf-8-sig', errors='replace')
             try:
-                return json.loads(content)
+                return _json_loads(content)
             except json.JSONDecodeError as e:
                 logger.error(f"JSON parsing error: {e}")
                 raise
@@ -192,69 +278,146 @@ def restore_json_load() -> None:
         _original_json_load = None
         _patches_applied['json_load'] = False
 
+def _json_loads(content):
+    """Parse JSON from text or UTF-8 bytes, using orjson when it is installed"""
+    # Strip a UTF-8 byte order mark, which neither parser accepts
+    if isinstance(content, bytes) and content.startswith(codecs.BOM_UTF8):
+        content = content[len(codecs.BOM_UTF8):]
+    elif isinstance(content, str) and content.startswith('\ufeff'):
+        content = content[1:]
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 def load_config(config_path: str) -> dict:
     """Load configuration file with proper encoding handling"""
     config_path = Path(config_path).resolve()
-    
-    try:
-        with codecs.open(str(config_path), 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except UnicodeDecodeError:
-        # Fallback to utf-8-sig if regular utf-8 fails
-        with codecs.open(str(config_path), 'r', encoding='utf-8-sig') as f:
-            return json.load(f)
-
-# Initialize espeak-ng
-phonemizer_available = False  # Global flag to track if phonemizer is working
-try:
-    from phonemizer.backend.espeak.wrapper import EspeakWrapper
-    from phonemizer import phonemize
-    import espeakng_loader
 
-    # Make library available first
-    library_path = espeakng_loader.get_library_path()
-    data_path = espeakng_loader.get_data_path()
-    espeakng_loader.make_library_available()
+    with open(config_path, 'rb') as f:
+        return _json_loads(f.read())
 
-    # Set up espeak-ng paths
-    EspeakWrapper.library_path = library_path
-    EspeakWrapper.data_path = data_path
+# Initialize espeak-ng lazily; importing phonemizer and running a test phonemization
+# costs seconds, which callers such as list_available_voices should not pay
+phonemizer_available = False  # Global flag to track if phonemizer is working
+_phonemizer_initialized = False
+_phonemizer_init_lock = threading.Lock()
+
+def _ensure_phonemizer() -> bool:
+    """Set up espeak-ng for the phonemizer on first use
 
-    # Verify espeak-ng is working
+    Returns:
+        True if the phonemizer is working, False otherwise
+    """
+    global phonemizer_available, _phonemizer_initialized
+    if _phonemizer_initialized:
+        return phonemizer_available
+    with _phonemizer_init_lock:
+        if not _phonemizer_initialized:
+            _init_phonemizer()
+            _phonemizer_initialized = True
+    return phonemizer_available
+
+def _init_phonemizer() -> None:
+    """Point the phonemizer at espeakng_loader's library and create the en-us backend"""
+    global phonemizer_available
     try:
-        test_phonemes = phonemize('test', language='en-us')
-        if test_phonemes:
+        from phonemizer.backend.espeak.wrapper import EspeakWrapper
+        import espeakng_loader
+
+        # Make library available first
+        library_path = espeakng_loader.get_library_path()
+        data_path = espeakng_loader.get_data_path()
+        espeakng_loader.make_library_available()
+
+        # Set up espeak-ng paths
+        EspeakWrapper.library_path = library_path
+        EspeakWrapper.data_path = data_path
+
+        # KPipeline's G2P creates its own backend, so building one here would load
+        # the dictionaries twice; only the opt-in smoke test does
+        try:
+            if os.environ.get("KOKORO_VERIFY_PHONEMIZER"):
+                from phonemizer.backend import EspeakBackend
+                backend = EspeakBackend(
+                    language='en-us',
+                    preserve_punctuation=True,
+                    with_stress=True,
+                    language_switch='remove-flags'
+                )
+                test_phonemes = backend.phonemize(['test'], strip=True, njobs=1)
+                if not (test_phonemes and test_phonemes[0]):
+                    print("Note: Phonemization returned empty result")
+                    print("TTS will work, but phoneme visualization will be disabled")
+                    return
             phonemizer_available = True
             print("Phonemizer successfully initialized")
-        else:
-            print("Note: Phonemization returned empty result")
+        except Exception as e:
+            # Continue without espeak functionality - be more specific about error types
+            if "espeak" in str(e).lower():
+                print(f"Note: eSpeak not found: {e}")
+            else:
+                print(f"Note: Phonemizer initialization error: {e}")
             print("TTS will work, but phoneme visualization will be disabled")
-    except Exception as e:
-        # Continue without espeak functionality - be more specific about error types
-        if "espeak" in str(e).lower():
-            print(f"Note: eSpeak not found: {e}")
-        else:
-            print(f"Note: Phonemizer initialization error: {e}")
-        print("TTS will work, but phoneme visualization will be disabled")
 
-except ImportError as e:
-    print(f"Note: Phonemizer packages not installed: {e}")
-    print("TTS will work, but phoneme visualization will be disabled")
-    # Rather than automatically installing packages, inform the user
-    print("If you want phoneme visualization, manually install required packages:")
-    print("pip install espeakng-loader phonemizer-fork")
+    except ImportError as e:
+        print(f"Note: Phonemizer packages not installed: {e}")
+        print("TTS will work, but phoneme visualization will be disabled")
+        # Rather than automatically installing packages, inform the user
+        print("If you want phoneme visualization, manually install required packages:")
+        print("pip install espeakng-loader phonemizer-fork")
 
 # Initialize pipeline globally with thread safety
 _pipeline = None
 _pipeline_lock = threading.RLock()  # Reentrant lock for thread safety
+_preload_thread: Optional[threading.Thread] = None  # Background voice preload started by build_model
+# Serializes synthesis on the shared pipeline: KPipeline's G2P (including misaki's
+# espeak fallback) and KModel are not safe to drive from several threads at once
+_synthesis_lock = threading.Lock()
 _voice_cache_lock = threading.RLock()  # Separate lock for voice cache operations
 _download_lock = threading.Lock()  # Lock for download operations
+_DOWNLOAD_WORKERS = 8  # Concurrent voice file downloads
+_MIN_VOICE_BYTES = 1024  # Smaller voice files are treated as truncated downloads
+# Never touch the network; only files already on disk or in the HF cache are used
+KOKORO_OFFLINE = bool(os.environ.get("KOKORO_OFFLINE"))
+
+def _is_client_error(error: Exception) -> bool:
+    """Check whether a Hugging Face download failed with a 4xx HTTP status"""
+    response = getattr(error, 'response', None)
+    status_code = getattr(response, 'status_code', None)
+    return status_code is not None and 400 <= status_code < 500
+
+def _hf_hub_fetch(filename: str, local_dir: str, repo_version: str) -> str:
+    """Fetch a file from the Kokoro repository, reusing a local copy when present
+
+    Returns:
+        Path to the local file
+    """
+    from huggingface_hub import hf_hub_download
+    from huggingface_hub.utils import LocalEntryNotFoundError
+
+    try:
+        return hf_hub_download(
+            repo_id="hexgrad/Kokoro-82M",
+            filename=filename,
+            local_dir=local_dir,
+            revision=repo_version,
+            local_files_only=True
+        )
+    except LocalEntryNotFoundError:
+        if KOKORO_OFFLINE:
+            raise
+        return hf_hub_download(
+            repo_id="hexgrad/Kokoro-82M",
+            filename=filename,
+            local_dir=local_dir,
+            revision=repo_version
+        )
 
 def download_voice_files(voice_files: Optional[List[str]] = None, repo_version: str = "main", required_count: int = 1) -> List[str]:
     """Download voice files from Hugging Face with enhanced progress tracking.
 
     Args:
-        voice_files: Optional list of voice files to download. If None, download all VOICE_FILES.
+        voice_files: Optional iterable of voice files to download. If None, download all VOICE_FILES.
         repo_version: Version/tag of the repository to use (default: "main")
         required_count: Minimum number of voices required (default: 1)
 
@@ -264,106 +427,140 @@ def download_voice_files(voice_files: Optional[List[str]] = None, repo_version:
     Raises:
         ValueError: If fewer than required_count voices could be downloaded
     """
-    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from concurrent.futures import as_completed
     from tqdm import tqdm
     import hashlib
-    import time
+    import tempfile
     
     # Use absolute path for voices directory
-    voices_dir = Path("voices").resolve()
+    voices_dir = VOICES_DIR
     voices_dir.mkdir(exist_ok=True)
 
     # Import here to avoid startup dependency
-    from huggingface_hub import hf_hub_download
-    downloaded_voices = []
+    from huggingface_hub import hf_hub_download, snapshot_download
     failed_voices = []
 
     # If specific voice files are requested, use those. Otherwise use all.
-    files_to_download = voice_files if voice_files is not None else VOICE_FILES
-    total_files = len(files_to_download)
+    requested_files = frozenset(voice_files) if voice_files is not None else VOICE_FILES
+    total_files = len(requested_files)
 
     logger.info(f"Downloading voice files... ({total_files} total files)")
 
-    # Check for existing voice files first
-    existing_files = []
-    for voice_file in files_to_download:
-        voice_path = voices_dir / voice_file
-        if voice_path.exists() and voice_path.stat().st_size > 0:
-            logger.info(f"Voice file {voice_file} already exists")
-            downloaded_voices.append(voice_file)
-            existing_files.append(voice_file)
+    # Check for existing voice files with a single directory sweep
+    existing_files = {
+        entry.name for entry in os.scandir(voices_dir)
+        if entry.is_file() and entry.stat().st_size >= _MIN_VOICE_BYTES
+    }
+    downloaded_voices = sorted(requested_files & existing_files)
+    if downloaded_voices:
+        logger.info(f"{len(downloaded_voices)} voice files already exist")
 
     # Remove existing files from the download list
-    files_to_download = [f for f in files_to_download if f not in existing_files]
+    files_to_download = sorted(requested_files - existing_files)
     if not files_to_download and downloaded_voices:
         logger.info(f"All required voice files already exist ({len(downloaded_voices)} files)")
         return downloaded_voices
 
-    def download_single_voice(voice_file: str) -> tuple[str, bool, str]:
+    def install_voice(temp_path: str, voice_file: str) -> None:
+        """Verify a downloaded voice file and move it into the voices directory"""
+        # Verify file integrity with basic size check
+        if Path(temp_path).stat().st_size < _MIN_VOICE_BYTES:
+            raise ValueError(f"Downloaded file {voice_file} is truncated")
+
+        # Move to final location: a metadata-only rename on the same
+        # filesystem, falling back to a byte copy across filesystems
+        voice_path = voices_dir / voice_file
+        try:
+            os.replace(temp_path, str(voice_path))
+        except OSError:
+            shutil.copy2(temp_path, str(voice_path))
+
+    def download_single_voice(voice_file: str, download_dir: str) -> tuple[str, bool, str]:
         """Download a single voice file with retry logic"""
         retry_count = 3
-        retry_delay = 2
-        
+
         for attempt in range(retry_count):
             try:
-                # Download with exponential backoff
+                # Download with capped exponential backoff
                 if attempt > 0:
-                    delay = retry_delay * (2 ** (attempt - 1))
-                    time.sleep(delay)
-                
-                # Download to a temporary location first
-                import tempfile
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.pt') as temp_file:
-                    temp_path = hf_hub_download(
-                        repo_id="hexgrad/Kokoro-82M",
-                        filename=f"voices/{voice_file}",
-                        local_dir=temp_file.name + "_dir",
-                        force_download=True,
-                        revision=repo_version
-                    )
-                    
-                    # Verify file integrity with basic size check
-                    if Path(temp_path).stat().st_size == 0:
-                        raise ValueError(f"Downloaded file {voice_file} has zero size")
-                    
-                    # Move to final location
-                    voice_path = voices_dir / voice_file
-                    shutil.move(temp_path, str(voice_path))
-                    
-                    return voice_file, True, f"Successfully downloaded {voice_file}"
-                    
+                    time.sleep(min(2 ** attempt * 0.25, 5.0))
+
+                # Download to a temporary location first; each voice gets its
+                # own file name, so concurrent workers can share the directory
+                temp_path = hf_hub_download(
+                    repo_id="hexgrad/Kokoro-82M",
+                    filename=f"voices/{voice_file}",
+                    local_dir=download_dir,
+                    revision=repo_version
+                )
+                install_voice(temp_path, voice_file)
+
+                return voice_file, True, f"Successfully downloaded {voice_file}"
+
             except Exception as e:
                 error_msg = f"Failed to download {voice_file} (attempt {attempt+1}/{retry_count}): {e}"
-                if attempt == retry_count - 1:
+                # Client errors (missing file, bad revision) will not succeed on retry
+                if attempt == retry_count - 1 or _is_client_error(e):
                     return voice_file, False, error_msg
                 logger.warning(error_msg)
         
         return voice_file, False, f"Failed all {retry_count} attempts to download {voice_file}"
 
+    if files_to_download and KOKORO_OFFLINE:
+        logger.warning(f"KOKORO_OFFLINE is set; skipping download of {len(files_to_download)} missing voice files")
+        failed_voices.extend(files_to_download)
+        files_to_download = []
+
     # Download files with progress bar and parallel processing
     if files_to_download:
         logger.info(f"Downloading {len(files_to_download)} missing voice files...")
         
-        with ThreadPoolExecutor(max_workers=3) as executor:  # Limit concurrent downloads
-            # Submit all download tasks
-            future_to_voice = {
-                executor.submit(download_single_voice, voice_file): voice_file
-                for voice_file in files_to_download
-            }
-            
-            # Process completed downloads with progress bar
-            with tqdm(total=len(files_to_download), desc="Downloading voices") as pbar:
-                for future in as_completed(future_to_voice):
-                    voice_file, success, message = future.result()
-                    
-                    if success:
-                        downloaded_voices.append(voice_file)
-                        logger.info(message)
-                    else:
-                        failed_voices.append(voice_file)
-                        logger.error(message)
-                    
-                    pbar.update(1)
+        # The temp dir sits next to voices/ so os.replace stays on one filesystem
+        with tempfile.TemporaryDirectory(dir=str(voices_dir.parent)) as download_dir:
+            # Fetch all missing voices in one snapshot: a single manifest request,
+            # with the hub's own thread pool doing the transfers
+            try:
+                snapshot_download(
+                    repo_id="hexgrad/Kokoro-82M",
+                    revision=repo_version,
+                    allow_patterns=[f"voices/{voice_file}" for voice_file in files_to_download],
+                    local_dir=download_dir,
+                    max_workers=_DOWNLOAD_WORKERS
+                )
+            except Exception as e:
+                logger.warning(f"Bulk voice download failed, falling back to per-file downloads: {e}")
+
+            remaining_files = []
+            for voice_file in files_to_download:
+                try:
+                    install_voice(os.path.join(download_dir, "voices", voice_file), voice_file)
+                    downloaded_voices.append(voice_file)
+                except (OSError, ValueError):
+                    remaining_files.append(voice_file)
+
+            # Retry anything the snapshot missed file by file. Downloads are
+            # network-latency bound, so more workers than cores is fine.
+            if remaining_files:
+                with ThreadPoolExecutor(max_workers=_DOWNLOAD_WORKERS) as executor:
+                    # Submit all download tasks
+                    future_to_voice = {
+                        executor.submit(download_single_voice, voice_file, download_dir): voice_file
+                        for voice_file in remaining_files
+                    }
+
+                    # Process completed downloads with progress bar
+                    with tqdm(total=len(remaining_files), desc="Downloading voices") as pbar:
+                        for future in as_completed(future_to_voice):
+                            voice_file, success, message = future.result()
+
+                            if success:
+                                downloaded_voices.append(voice_file)
+                                logger.info(message)
+                            else:
+                                failed_voices.append(voice_file)
+                                logger.error(message)
+
+                            pbar.update(1)
 
     # Report results
     if failed_voices:
@@ -382,18 +579,248 @@ def download_voice_files(voice_files: Optional[List[str]] = None, repo_version:
 
     return downloaded_voices
 
-def build_model(model_path: str, device: str, repo_version: str = "main") -> EnhancedKPipeline:
+# Supported inference precisions; 'auto' picks bf16 or fp16 on CUDA and fp32 elsewhere
+DTYPE_CHOICES = ('fp32', 'bf16', 'fp16', 'auto')
+_DTYPES = {
+    'fp32': torch.float32,
+    'bf16': torch.bfloat16,
+    'fp16': torch.float16,
+}
+
+def _resolve_dtype(dtype: str, device: str) -> torch.dtype:
+    """Map a precision name to a torch dtype, falling back to fp32 off CUDA"""
+    if dtype not in DTYPE_CHOICES:
+        raise ValueError(f"Unsupported dtype '{dtype}'. Choose from: {', '.join(DTYPE_CHOICES)}")
+    if not str(device).startswith('cuda'):
+        return torch.float32
+    if dtype == 'auto':
+        return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+    return _DTYPES[dtype]
+
+def _prepack_model(model_module: torch.nn.Module) -> int:
+    """Fold weight-norm reparametrizations into plain weights for inference
+
+    Weight norm recomputes weight = g * v / ||v|| before every forward call;
+    folding once at load time removes that per-call work. LSTM weights are
+    also compacted into the contiguous layout cuDNN expects.
+
+    Returns:
+        Number of weight-norm reparametrizations folded
+    """
+    from torch.nn.utils import parametrize
+    from torch.nn.utils.weight_norm import WeightNorm
+
+    folded = 0
+    for module in model_module.modules():
+        if parametrize.is_parametrized(module, 'weight'):
+            parametrize.remove_parametrizations(module, 'weight', leave_parametrized=True)
+            folded += 1
+        elif any(isinstance(hook, WeightNorm) for hook in module._forward_pre_hooks.values()):
+            torch.nn.utils.remove_weight_norm(module)
+            folded += 1
+        if isinstance(module, torch.nn.LSTM):
+            module.flatten_parameters()
+    return folded
+
+# Submodules quantized for CPU inference; the convolutional vocoder ('decoder')
+# is quality-sensitive and stays in fp32
+_QUANTIZE_SUBMODULES = ('bert', 'bert_encoder', 'predictor', 'text_encoder')
+
+def _quantize_model(model_module: torch.nn.Module) -> None:
+    """Apply int8 dynamic quantization to the Linear/LSTM layers of the text side"""
+    for name in _QUANTIZE_SUBMODULES:
+        submodule = getattr(model_module, name, None)
+        if isinstance(submodule, torch.nn.Module):
+            setattr(model_module, name, torch.ao.quantization.quantize_dynamic(
+                submodule, {torch.nn.Linear, torch.nn.LSTM}, dtype=torch.qint8
+            ))
+
+def _is_dynamic_int8(model_module: torch.nn.Module) -> bool:
+    """Whether _quantize_model has replaced any of the model's layers"""
+    return any(
+        isinstance(m, (torch.ao.nn.quantized.dynamic.Linear, torch.ao.nn.quantized.dynamic.LSTM))
+        for m in model_module.modules()
+    )
+
+def _autocast_forward(forward, dtype: torch.dtype):
+    """Wrap a module's forward in CUDA autocast and hand back fp32 audio"""
+    @functools.wraps(forward)
+    def wrapped(*args, **kwargs):
+        # Autocast keeps numerically sensitive ops (norms, STFT) in fp32
+        with torch.autocast(device_type='cuda', dtype=dtype):
+            output = forward(*args, **kwargs)
+        # Return fp32 audio so soundfile/numpy consumers are unaffected
+        if isinstance(output, torch.Tensor):
+            return output.float()
+        if isinstance(getattr(output, 'audio', None), torch.Tensor):
+            output.audio = output.audio.float()
+        return output
+    return wrapped
+
+def _compile_model(pipeline_instance: EnhancedKPipeline, device: str) -> None:
+    """Compile the model's tensor forward pass and warm it up
+
+    mode='reduce-overhead' records CUDA graphs for the compiled regions and
+    replays them on later calls with the same shapes. The whole forward cannot
+    be captured as a single manual torch.cuda.CUDAGraph: the duration predictor
+    decides the output length, so the alignment and decoder shapes depend on
+    the data. Graph breaks at that point let the regions on either side be replayed.
+
+    Failures are logged and leave the eager model in place, since torch.compile
+    needs a working Triton toolchain that is not available everywhere.
+    """
+    model_module = getattr(pipeline_instance, 'model', None)
+    if not hasattr(torch, 'compile') or not isinstance(model_module, torch.nn.Module):
+        return
+
+    eager_forward = model_module.forward_with_tokens
+    try:
+        # dynamic=True because token counts vary with every request
+        model_module.forward_with_tokens = torch.compile(
+            eager_forward, mode='reduce-overhead', fullgraph=False, dynamic=True
+        )
+        # Warm up here so compilation is not paid by the first user request;
+        # a zero style vector is enough to trace the graph without loading a voice
+        ref_s = torch.zeros(1, 256, device=device, dtype=pipeline_instance.dtype)
+        with torch.inference_mode():
+            model_module('a', ref_s)
+        logger.info("Compiled model with torch.compile")
+    except Exception as e:
+        model_module.forward_with_tokens = eager_forward
+        logger.warning(f"torch.compile failed, using eager model: {e}")
+
+def _script_decoder(pipeline_instance: EnhancedKPipeline) -> None:
+    """Replace the vocoder with a frozen, inference-optimized TorchScript module
+
+    Only the decoder is scripted: the text side goes through the transformers
+    ALBERT and data-dependent alignment code that TorchScript cannot compile,
+    and it is covered by int8 quantization on CPU instead. Freezing inlines the
+    weights as constants so the CPU fuser can fold the pointwise chains around
+    the convolutions. A short synthesis validates the scripted module; any
+    failure leaves the eager decoder in place.
+    """
+    model_module = getattr(pipeline_instance, 'model', None)
+    decoder = getattr(model_module, 'decoder', None)
+    if not isinstance(decoder, torch.nn.Module):
+        return
+
+    try:
+        model_module.decoder = torch.jit.optimize_for_inference(torch.jit.script(decoder.eval()))
+        ref_s = torch.zeros(1, 256, dtype=pipeline_instance.dtype)
+        with torch.inference_mode():
+            model_module('a', ref_s)
+        logger.info("Scripted decoder with TorchScript")
+    except Exception as e:
+        model_module.decoder = decoder
+        logger.warning(f"TorchScript conversion failed, using eager decoder: {e}")
+
+def _load_kmodel(model_path: str, config_path: str, device: str,
+                 dtype: torch.dtype = torch.float32) -> Optional[torch.nn.Module]:
+    """Build the KModel from the local checkpoint, staging weights on the CPU
+
+    KModel reads its checkpoint with map_location='cpu', so the full state dict
+    never sits on the GPU next to the parameters it is copied into. On GPU the
+    modules are constructed directly on the device, so checkpoint tensors are
+    copied straight into device parameters without an intermediate CPU model.
+    Reduced-precision models stay on the CPU so that build_model can fold and
+    cast them before upload, and the GPU never holds an fp32 copy.
+
+    Args:
+        model_path: Path to the local kokoro-v1_0.pth checkpoint
+        config_path: Path to the local config.json
+        device: Target device ('cuda' or 'cpu')
+        dtype: Inference precision build_model will cast to (default: torch.float32)
+
+    Returns:
+        The loaded KModel in eval mode, or None if this kokoro version has no KModel
+    """
+    try:
+        from kokoro import KModel
+    except ImportError:
+        return None
+
+    if device != 'cpu' and dtype == torch.float32:
+        # torch.device as a context manager sets the default device for new parameters
+        with torch.device(device):
+            model = KModel(repo_id='hexgrad/Kokoro-82M', config=config_path, model=model_path)
+    else:
+        model = KModel(repo_id='hexgrad/Kokoro-82M', config=config_path, model=model_path)
+    return model.eval()
+
+def _warmup_pipeline(pipeline_instance: EnhancedKPipeline) -> None:
+    """Run one short synthesis so first-request costs are paid at build time
+
+    Covers G2P initialization, CUDA context creation and kernel selection, and
+    the first call after torch.compile. A zero voice pack stands in for a real
+    voice, so no voice file has to be loaded first. Failures are logged only.
+    """
+    try:
+        pack = torch.zeros(510, 1, 256, device=pipeline_instance.device, dtype=pipeline_instance.dtype)
+        for _ in pipeline_instance("Warmup.", voice=pack):
+            pass
+        logger.info("Warmup complete")
+    except Exception as e:
+        logger.warning(f"Warmup failed, the first request will pay initialization costs: {e}")
+
+def _preload_voices(pipeline_instance: EnhancedKPipeline, voice_files: List[str]) -> None:
+    """Load voices into the pipeline so first requests for them skip disk I/O
+
+    Runs on a background thread; the lock is held per voice so generation
+    requests can interleave with the preload.
+    """
+    for voice_file in voice_files:
+        voice_name = Path(voice_file).stem
+        try:
+            with _pipeline_lock:
+                if voice_name not in pipeline_instance.voices:
+                    pipeline_instance.load_voice(_resolve_voice_path(voice_name))
+        except Exception as e:
+            logger.warning(f"Could not preload voice {voice_name}: {e}")
+    logger.info(f"Preloaded {len(pipeline_instance.voices)} voices")
+
+def wait_for_voice_preload(timeout: Optional[float] = None) -> int:
+    """Block until build_model's background voice preload has finished
+
+    Args:
+        timeout: Seconds to wait at most, or None to wait until it is done (default: None)
+
+    Returns:
+        Number of voices loaded into the pipeline so far (0 if no pipeline was built)
+    """
+    thread = _preload_thread
+    if thread is not None:
+        thread.join(timeout)
+    return len(_pipeline.voices) if _pipeline is not None else 0
+
+def build_model(model_path: str, device: str, repo_version: str = "main", dtype: Optional[str] = None,
+                compile_model: bool = False, quantize: Optional[bool] = None,
+                script_decoder: Optional[bool] = None) -> EnhancedKPipeline:
     """Build and return the Enhanced Kokoro pipeline with proper encoding configuration
 
     Args:
         model_path: Path to the model file or None to use default
         device: Device to use ('cuda' or 'cpu')
         repo_version: Version/tag of the repository to use (default: "main")
+        dtype: Inference precision, one of DTYPE_CHOICES. None uses the KOKORO_DTYPE
+            environment variable, or "fp32" if it is unset (default: None).
+            Reduced precision only applies on CUDA; "auto" picks bf16 on GPUs that
+            support it and fp16 on older ones.
+        compile_model: Compile the model with torch.compile on CUDA (default: False).
+            Setting KOKORO_COMPILE=1 in the environment also enables it
+        quantize: Use int8 dynamic quantization for CPU inference. None defers to
+            the KOKORO_INT8 environment variable ('1' or '0') and otherwise enables
+            it on CPU and disables it elsewhere (default: None)
+        script_decoder: TorchScript the vocoder for CPU inference. None defers to
+            KOKORO_SCRIPT=1 in the environment (default: None)
 
     Returns:
         Initialized EnhancedKPipeline instance
     """
-    global _pipeline, _pipeline_lock
+    global _pipeline, _pipeline_lock, _preload_thread
+
+    # Fast path once the pipeline exists, so repeated callers skip the lock
+    if _pipeline is not None:
+        return _pipeline
 
     # Use a lock for thread safety
     with _pipeline_lock:
@@ -402,6 +829,9 @@ def build_model(model_path: str, device: str, repo_version: str = "main") -> Enh
             return _pipeline
 
         try:
+            # Set up espeak-ng before the pipeline's G2P needs it
+            _ensure_phonemizer()
+
             # Patch json loading before initializing pipeline
             patch_json_load()
 
@@ -410,45 +840,45 @@ def build_model(model_path: str, device: str, repo_version: str = "main") -> Enh
                 model_path = 'kokoro-v1_0.pth'
 
             model_path = os.path.abspath(model_path)
-            if not os.path.exists(model_path):
-                print(f"Downloading model file {model_path}...")
-                try:
-                    from huggingface_hub import hf_hub_download
-                    model_path = hf_hub_download(
-                        repo_id="hexgrad/Kokoro-82M",
-                        filename="kokoro-v1_0.pth",
-                        local_dir=".",
-                        force_download=True,
-                        revision=repo_version
-                    )
-                    print(f"Model downloaded to {model_path}")
-                except Exception as e:
-                    print(f"Error downloading model: {e}")
-                    raise ValueError(f"Could not download model: {e}") from e
-
-            # Download config if it doesn't exist
             config_path = os.path.abspath("config.json")
-            if not os.path.exists(config_path):
-                print("Downloading config file...")
-                try:
-                    config_path = hf_hub_download(
-                        repo_id="hexgrad/Kokoro-82M",
-                        filename="config.json",
-                        local_dir=".",
-                        force_download=True,
-                        revision=repo_version
-                    )
-                    print(f"Config downloaded to {config_path}")
-                except Exception as e:
-                    print(f"Error downloading config: {e}")
-                    raise ValueError(f"Could not download config: {e}") from e
 
-            # Download voice files - require at least one voice
-            try:
-                downloaded_voices = download_voice_files(repo_version=repo_version, required_count=1)
-            except ValueError as e:
-                print(f"Error: Voice files download failed: {e}")
-                raise ValueError("Voice files download failed") from e
+            # Model, config and voice downloads are independent, so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                model_future = None
+                if not os.path.exists(model_path):
+                    print(f"Downloading model file {model_path}...")
+                    model_future = executor.submit(_hf_hub_fetch, "kokoro-v1_0.pth", ".", repo_version)
+
+                # Download config if it doesn't exist
+                config_future = None
+                if not os.path.exists(config_path):
+                    print("Downloading config file...")
+                    config_future = executor.submit(_hf_hub_fetch, "config.json", ".", repo_version)
+
+                # Download voice files - require at least one voice
+                voices_future = executor.submit(download_voice_files, repo_version=repo_version, required_count=1)
+
+                if model_future is not None:
+                    try:
+                        model_path = model_future.result()
+                        print(f"Model downloaded to {model_path}")
+                    except Exception as e:
+                        print(f"Error downloading model: {e}")
+                        raise ValueError(f"Could not download model: {e}") from e
+
+                if config_future is not None:
+                    try:
+                        config_path = config_future.result()
+                        print(f"Config downloaded to {config_path}")
+                    except Exception as e:
+                        print(f"Error downloading config: {e}")
+                        raise ValueError(f"Could not download config: {e}") from e
+
+                try:
+                    downloaded_voices = voices_future.result()
+                except ValueError as e:
+                    print(f"Error: Voice files download failed: {e}")
+                    raise ValueError("Voice files download failed") from e
 
             # Validate language code
             lang_code = 'a'  # Default to 'a' for American English
@@ -458,34 +888,78 @@ def build_model(model_path: str, device: str, repo_version: str = "main") -> Enh
                 print(f"Supported language codes: {', '.join(supported_codes)}")
                 lang_code = 'a'
 
+            # Load weights from the local files on the CPU, then move them to the device
+            if dtype is None:
+                dtype = os.environ.get("KOKORO_DTYPE", "fp32")
+            torch_dtype = _resolve_dtype(dtype, device)
+            kmodel = _load_kmodel(model_path, config_path, device, torch_dtype)
+
             # Initialize pipeline with validated language code
-            pipeline_instance = EnhancedKPipeline(lang_code=lang_code)
+            pipeline_instance = EnhancedKPipeline(lang_code=lang_code, model=kmodel if kmodel is not None else True)
             if pipeline_instance is None:
                 raise ValueError("Failed to initialize EnhancedKPipeline - pipeline is None")
 
             # Store device parameter for reference in other operations
             pipeline_instance.device = device
 
-            # Try to load the first available voice with improved error handling
-            voice_loaded = False
-            for voice_file in downloaded_voices:
-                voice_path = os.path.abspath(os.path.join("voices", voice_file))
-                if os.path.exists(voice_path):
-                    try:
-                        pipeline_instance.load_voice(voice_path)
-                        print(f"Successfully loaded voice: {voice_file}")
-                        voice_loaded = True
-                        break  # Successfully loaded a voice
-                    except Exception as e:
-                        print(f"Warning: Failed to load voice {voice_file}: {e}")
-                        continue
+            model_module = getattr(pipeline_instance, 'model', None)
+            if isinstance(model_module, torch.nn.Module):
+                model_module.eval()
+                folded = _prepack_model(model_module)
+                logger.info(f"Folded {folded} weight-norm layers for inference")
+                # Folding creates fresh Parameters; inference never needs their gradients
+                model_module.requires_grad_(False)
+                # KModel.forward only uses no_grad; inference_mode also skips version counter bumps
+                model_module.forward = torch.inference_mode()(model_module.forward)
+
+            # Downcast weights on CUDA; inference is memory-bandwidth bound.
+            # A locally built model is still on the CPU here, so this cast is also its upload
+            if torch_dtype != torch.float32:
+                if isinstance(model_module, torch.nn.Module):
+                    model_module.to(device=device, dtype=torch_dtype)
+                    model_module.forward = _autocast_forward(model_module.forward, torch_dtype)
+                    pipeline_instance.dtype = torch_dtype
+                    logger.info(f"Running model in {torch_dtype} on {device}")
+
+            if (compile_model or os.environ.get("KOKORO_COMPILE") == "1") and str(device).startswith('cuda'):
+                _compile_model(pipeline_instance, device)
+
+            if script_decoder is None:
+                script_decoder = os.environ.get("KOKORO_SCRIPT") == "1"
+            if script_decoder and device == 'cpu':
+                _script_decoder(pipeline_instance)
+
+            # int8 GEMMs (FBGEMM/VNNI) outpace fp32 on CPU; quantized kernels are CPU-only
+            if quantize is None:
+                env_int8 = os.environ.get("KOKORO_INT8")
+                quantize = env_int8 == "1" if env_int8 in ("0", "1") else device == 'cpu'
+            if quantize and device == 'cpu' and isinstance(model_module, torch.nn.Module):
+                try:
+                    _quantize_model(model_module)
+                    logger.info("Applied int8 dynamic quantization for CPU inference")
+                except Exception as e:
+                    logger.warning(f"Dynamic quantization failed, using fp32 model: {e}")
+
+            # Pay one-time initialization now rather than on the first request
+            if not os.environ.get("KOKORO_SKIP_WARMUP"):
+                _warmup_pipeline(pipeline_instance)
 
-            if not voice_loaded:
-                print("Warning: Could not load any voice models")
+            # Voices are loaded in the background below; load_voice/generate_speech
+            # still load on demand if a request arrives first
 
-            # Set the global _pipeline only after successful initialization
+            # Set the global _pipeline only after successful initialization; cached
+            # phonemes are keyed on the pipeline and would keep a replaced one alive
+            clear_phonemize_cache()
             _pipeline = pipeline_instance
 
+            _preload_thread = threading.Thread(
+                target=_preload_voices,
+                args=(pipeline_instance, downloaded_voices),
+                name="kokoro-voice-preload",
+                daemon=True
+            )
+            _preload_thread.start()
+
         except Exception as e:
             print(f"Error initializing pipeline: {e}")
             # Restore original json.load on error
@@ -494,10 +968,37 @@ def build_model(model_path: str, device: str, repo_version: str = "main") -> Enh
 
         return _pipeline
 
-def list_available_voices() -> List[str]:
-    """List all available voice models"""
+# Cached voice listing keyed on the voices directory mtime: (st_mtime_ns, checked at, sorted names)
+_voice_list_cache: Optional[Tuple[int, float, List[str]]] = None
+_VOICE_LIST_TTL = 5.0  # Seconds a listing is trusted without re-checking the directory
+
+def _scan_voice_files(directory: Path) -> List[os.DirEntry]:
+    """Return the .pt file entries of a directory in a single scandir pass"""
+    with os.scandir(directory) as it:
+        return [entry for entry in it if entry.name.endswith('.pt') and entry.is_file()]
+
+def list_available_voices(force_refresh: bool = False) -> List[str]:
+    """List all available voice models
+
+    Args:
+        force_refresh: Rescan the voices directory instead of using the cached listing,
+            e.g. right after downloading voices (default: False)
+
+    Returns:
+        Sorted list of voice names
+    """
+    global _voice_list_cache
+
+    if force_refresh:
+        _voice_list_cache = None
+
+    # UIs poll this; within the TTL skip even the directory stat
+    now = time.monotonic()
+    if _voice_list_cache is not None and now - _voice_list_cache[1] < _VOICE_LIST_TTL:
+        return list(_voice_list_cache[2])
+
     # Always use absolute path for consistency
-    voices_dir = Path(os.path.abspath("voices"))
+    voices_dir = VOICES_DIR
 
     # Create voices directory if it doesn't exist
     if not voices_dir.exists():
@@ -505,39 +1006,51 @@ def list_available_voices() -> List[str]:
         voices_dir.mkdir(exist_ok=True)
         return []
 
+    # Adding or removing files updates the directory mtime, which invalidates the cache
+    dir_mtime = voices_dir.stat().st_mtime_ns
+    if _voice_list_cache is not None and _voice_list_cache[0] == dir_mtime:
+        _voice_list_cache = (dir_mtime, now, _voice_list_cache[2])
+        return list(_voice_list_cache[2])
+
     # Get all .pt files in the voices directory
-    voice_files = list(voices_dir.glob("*.pt"))
+    voice_names = [entry.name[:-3] for entry in _scan_voice_files(voices_dir)]
 
     # If we found voice files, return them
-    if voice_files:
-        return [f.stem for f in sorted(voice_files, key=lambda f: f.stem.lower())]
+    if voice_names:
+        voice_names.sort(key=str.lower)
+        _voice_list_cache = (dir_mtime, now, voice_names)
+        return list(voice_names)
 
     # If no voice files in standard location, check if we need to do a one-time migration
     # This is legacy support for older installations
     alt_voices_path = Path(".") / "voices"
     if alt_voices_path.exists() and alt_voices_path.is_dir() and alt_voices_path != voices_dir:
         print(f"Checking alternative voice location: {alt_voices_path.absolute()}")
-        alt_voice_files = list(alt_voices_path.glob("*.pt"))
+        alt_voice_files = _scan_voice_files(alt_voices_path)
 
         if alt_voice_files:
             print(f"Found {len(alt_voice_files)} voice files in alternate location")
             print("Moving files to the standard voices directory...")
 
             # Process files in a batch for efficiency
-            files_moved = 0
+            moved_voices = []
             for voice_file in alt_voice_files:
                 target_path = voices_dir / voice_file.name
                 if not target_path.exists():
                     try:
-                        # Use copy2 to preserve metadata, then remove original if successful
-                        shutil.copy2(str(voice_file), str(target_path))
-                        files_moved += 1
+                        # Same-filesystem rename is metadata-only; shutil.move copies across filesystems
+                        try:
+                            os.rename(voice_file.path, str(target_path))
+                        except OSError:
+                            shutil.move(voice_file.path, str(target_path))
+                        moved_voices.append(target_path.stem)
                     except (OSError, IOError) as e:
-                        print(f"Error copying {voice_file.name}: {e}")
+                        print(f"Error moving {voice_file.name}: {e}")
 
-            if files_moved > 0:
-                print(f"Successfully moved {files_moved} voice files")
-                return [f.stem for f in sorted(voices_dir.glob("*.pt"), key=lambda f: f.stem.lower())]
+            if moved_voices:
+                # The standard directory held no voices, so the moved files are the full set
+                print(f"Successfully moved {len(moved_voices)} voice files")
+                return sorted(moved_voices, key=str.lower)
 
     print("No voice files found. Please run the application again to download voices.")
     return []
@@ -554,20 +1067,65 @@ def get_language_code_from_voice(voice_name: str) -> str:
     # Extract prefix from voice name
     prefix = voice_name[:2] if len(voice_name) >= 2 else 'af'
 
-    # Map voice prefixes to language codes
-    prefix_to_lang = {
-        'af': 'a', 'am': 'a',  # American English
-        'bf': 'b', 'bm': 'b',  # British English
-        'jf': 'j', 'jm': 'j',  # Japanese
-        'zf': 'z', 'zm': 'z',  # Mandarin Chinese
-        'ef': 'e', 'em': 'e',  # Spanish
-        'ff': 'f', 'fm': 'f',  # French
-        'hf': 'h', 'hm': 'h',  # Hindi
-        'if': 'i', 'im': 'i',  # Italian
-        'pf': 'p', 'pm': 'p',  # Brazilian Portuguese
-    }
+    return _VOICE_PREFIX_TO_LANG.get(prefix, 'a')  # Default to American English
+
+@functools.lru_cache(maxsize=128)
+def _resolve_voice_path(voice_name: str) -> str:
+    """Resolve a voice name to its .pt file path, memoized per voice name
+
+    Raises:
+        ValueError: If voice file not found (failures are not cached)
+    """
+    voice_path = VOICES_DIR / f"{voice_name}.pt"
+    if not voice_path.exists():
+        raise ValueError(f"Voice file not found: {voice_path}")
+    return str(voice_path)
+
+# Tensor name used for voice packs converted to safetensors
+_SAFETENSORS_KEY = "voice"
+
+def _ensure_safetensors(voice_path: Path) -> Optional[Path]:
+    """Convert a .pt voice pack to a sibling .safetensors file on first use
+
+    Args:
+        voice_path: Path to the .pt voice file
 
-    return prefix_to_lang.get(prefix, 'a')  # Default to American English
+    Returns:
+        Path to the up-to-date .safetensors file, or None if safetensors is
+        not installed or the conversion failed
+    """
+    try:
+        from safetensors.torch import save_file
+    except ImportError:
+        return None
+
+    safetensors_path = voice_path.with_suffix('.safetensors')
+    if safetensors_path.exists() and safetensors_path.stat().st_mtime >= voice_path.stat().st_mtime:
+        return safetensors_path
+
+    try:
+        voice_tensor = torch.load(str(voice_path), weights_only=True, map_location='cpu')
+        # Write to a temporary name first so readers never see a partial file
+        temp_path = safetensors_path.with_name(safetensors_path.name + '.tmp')
+        save_file({_SAFETENSORS_KEY: voice_tensor.contiguous()}, str(temp_path))
+        os.replace(temp_path, safetensors_path)
+        logger.info(f"Converted voice {voice_path.stem} to safetensors")
+        return safetensors_path
+    except Exception as e:
+        logger.warning(f"Could not convert voice {voice_path.stem} to safetensors: {e}")
+        return None
+
+def migrate_voices_to_safetensors() -> int:
+    """Pre-convert every voice in the voices directory to safetensors
+
+    Returns:
+        Number of voices available in safetensors format
+    """
+    converted = 0
+    for voice_path in sorted(VOICES_DIR.glob("*.pt")):
+        if _ensure_safetensors(voice_path) is not None:
+            converted += 1
+    return converted
 
 def load_voice(voice_name: str, device: str) -> torch.Tensor:
     """Load a voice model in a thread-safe manner
@@ -585,11 +1143,14 @@ def load_voice(voice_name: str, device: str) -> torch.Tensor:
     pipeline = build_model(None, device)
 
     # Format voice path correctly - strip .pt if it was included
-    voice_name = voice_name.replace('.pt', '')
-    voice_path = Path("voices").resolve() / f"{voice_name}.pt"
+    voice_name = voice_name.removesuffix('.pt')
 
-    if not voice_path.exists():
-        raise ValueError(f"Voice file not found: {voice_path}")
+    # Warm path: already loaded voices are served from RAM without the lock
+    voice_tensor = pipeline.voices.get(voice_name)
+    if voice_tensor is not None:
+        return voice_tensor
+
+    voice_path = _resolve_voice_path(voice_name)
 
     # Use a lock to ensure thread safety when loading voices
     with _pipeline_lock:
@@ -598,44 +1159,125 @@ def load_voice(voice_name: str, device: str) -> torch.Tensor:
             return pipeline.voices[voice_name]
 
         # Load voice if not already loaded
-        return pipeline.load_voice(str(voice_path))
+        return pipeline.load_voice(voice_path)
 
-def generate_speech(
+def audio_to_tensor(audio) -> torch.Tensor:
+    """Convert a generated audio segment to a float32 tensor without redundant copies"""
+    if isinstance(audio, torch.Tensor):
+        return audio
+    if audio.dtype == np.float32:
+        return torch.from_numpy(audio)  # Zero-copy view
+    # Downcast in numpy once so torch never sees the wider type
+    return torch.from_numpy(np.ascontiguousarray(audio, dtype=np.float32))
+
+def concat_audio(segments: List[torch.Tensor], total_samples: Optional[int] = None) -> torch.Tensor:
+    """Join audio segments into one preallocated float32 CPU buffer
+
+    Args:
+        segments: Audio segments in playback order; the list is emptied as segments are copied
+        total_samples: Combined length if already tracked while generating (default: computed)
+
+    Returns:
+        1-D float32 tensor holding all segments back to back
+    """
+    if len(segments) == 1:
+        return segments.pop().float().cpu()
+
+    if total_samples is None:
+        total_samples = sum(segment.shape[0] for segment in segments)
+
+    # One allocation; each copy also performs any device/dtype conversion
+    out = torch.empty(total_samples, dtype=torch.float32)
+    offset = 0
+    for segment in segments:
+        n = segment.shape[0]
+        out[offset:offset + n].copy_(segment)
+        offset += n
+
+    # Release the segments now rather than when the caller's list goes out of scope
+    segments.clear()
+    return out
+
+def generate_speech_stream(
     model: EnhancedKPipeline,
     text: str,
-    voice: str,
+    voice: Union[str, torch.Tensor],
     lang: str = 'a',
     device: str = 'cpu',
-    speed: float = 1.0
-) -> Tuple[Optional[torch.Tensor], Optional[str]]:
-    """Generate speech using the Kokoro pipeline in a thread-safe manner
+    speed: float = 1.0,
+    sentence_chunks: bool = False
+) -> Iterator[Tuple[torch.Tensor, str]]:
+    """Generate speech segment by segment as the Kokoro pipeline produces it
 
     Args:
         model: EnhancedKPipeline instance
         text: Text to synthesize
-        voice: Voice name (e.g. 'af_bella')
+        voice: Voice name (e.g. 'af_bella'), or an already loaded voice pack tensor
         lang: Language code ('a' for American English, 'b' for British English)
         device: Device to use ('cuda' or 'cpu')
         speed: Speech speed multiplier (default: 1.0)
+        sentence_chunks: Synthesize sentence by sentence instead of paragraph by
+            paragraph, so the first segment of a long text arrives after one
+            sentence rather than a full paragraph (default: False)
 
-    Returns:
-        Tuple of (audio tensor, phonemes string) or (None, None) on error
+    Yields:
+        Tuples of (audio tensor, phonemes string), one per segment
+
+    Raises:
+        ValueError: If the model is missing or the voice cannot be loaded
+    """
+    voice_tensor = _voice_for_generation(model, voice, device)
+
+    # Per-call log stays at debug level
+    logger.debug("Generating speech with device: %s", model.device)
+    generator = model(
+        text,
+        voice=voice_tensor,
+        speed=speed,
+        split_pattern=_SENTENCE_SPLIT_PATTERN if sentence_chunks else SPLIT_PATTERN
+    )
+
+    # Yield segments as they are produced, converting numpy arrays to tensors if needed.
+    # Each pipeline step runs under _synthesis_lock; the lock is released while the
+    # caller handles a segment, so concurrent streams interleave segment by segment
+    try:
+        while True:
+            with _synthesis_lock:
+                result = next(generator, None)
+            if result is None:
+                break
+            gs, ps, audio = result
+            if audio is not None:
+                yield audio_to_tensor(audio), ps
+    finally:
+        generator.close()
+
+def _voice_for_generation(model: EnhancedKPipeline, voice: Union[str, torch.Tensor], device: str) -> torch.Tensor:
+    """Return the voice pack tensor for a generation request, loading it if needed
+
+    Raises:
+        ValueError: If the model is missing or the voice cannot be loaded
     """
     global _pipeline_lock
 
-    try:
-        if model is None:
-            raise ValueError("Model is None - pipeline not properly initialized")
+    if model is None:
+        raise ValueError("Model is None - pipeline not properly initialized")
 
-        # Format voice name and path
-        voice_name = voice.replace('.pt', '')
-        voice_path = Path("voices").resolve() / f"{voice_name}.pt"
+    # Callers that resolve voices themselves pass the loaded pack
+    if isinstance(voice, torch.Tensor):
+        return voice
 
-        # Check if voice file exists
-        if not voice_path.exists():
-            raise ValueError(f"Voice file not found: {voice_path}")
+    # Format voice name and path
+    voice_name = voice.removesuffix('.pt')
+    voice_path = _resolve_voice_path(voice_name)
+
+    _ensure_phonemizer()
 
-        # Thread-safe initialization of model properties and voice loading
+    # Lock-free fast path for warm voices: dict reads and writes are atomic
+    # under the GIL, so the lock only guards device changes and voice loads.
+    # The voice pack is the conditioning tensor; hand it over directly.
+    voice_tensor = model.voices.get(voice_name) if model.device == device else None
+    if voice_tensor is None:
         with _pipeline_lock:
             # Ensure device is set
             model.device = device
@@ -644,29 +1286,64 @@ def generate_speech(
             if voice_name not in model.voices:
                 logger.info(f"Loading voice {voice_name}...")
                 try:
-                    model.load_voice(str(voice_path))
+                    model.load_voice(voice_path)
                     if voice_name not in model.voices:
                         raise ValueError("Voice load succeeded but voice not in model.voices dictionary")
                 except Exception as e:
                     raise ValueError(f"Failed to load voice {voice_name}: {e}")
 
-        # Generate speech (outside the lock for better concurrency)
-        logger.info(f"Generating speech with device: {model.device}")
-        generator = model(
-            text,
-            voice=str(voice_path),
-            speed=speed,
-            split_pattern=r'\n+'
-        )
+            voice_tensor = model.voices[voice_name]
 
-        # Get first generated segment and convert numpy array to tensor if needed
-        for gs, ps, audio in generator:
-            if audio is not None:
-                if isinstance(audio, np.ndarray):
-                    audio = torch.from_numpy(audio).float()
-                return audio, ps
+    return voice_tensor
 
+def _join_segments(chunks: List[Tuple[torch.Tensor, str]],
+                   gap_samples: int = _SEGMENT_GAP_SAMPLES) -> Tuple[Optional[torch.Tensor], Optional[str]]:
+    """Join (audio, phonemes) segments with a short silence gap between them"""
+    if not chunks:
         return None, None
+    if len(chunks) == 1:
+        return chunks[0]
+
+    # Join segments in a single concatenation with silence between them
+    pieces = [chunks[0][0]]
+    if gap_samples > 0:
+        gap = chunks[0][0].new_zeros(gap_samples)
+        for audio, _ in chunks[1:]:
+            pieces.extend((gap, audio))
+    else:
+        pieces.extend(audio for audio, _ in chunks[1:])
+    return torch.cat(pieces, dim=0), '\n'.join(ps for _, ps in chunks)
+
+def generate_speech(
+    model: EnhancedKPipeline,
+    text: str,
+    voice: str,
+    lang: str = 'a',
+    device: str = 'cpu',
+    speed: float = 1.0,
+    return_all: bool = False
+) -> Tuple[Optional[torch.Tensor], Optional[str]]:
+    """Generate speech using the Kokoro pipeline in a thread-safe manner
+
+    Args:
+        model: EnhancedKPipeline instance
+        text: Text to synthesize
+        voice: Voice name (e.g. 'af_bella')
+        lang: Language code ('a' for American English, 'b' for British English)
+        device: Device to use ('cuda' or 'cpu')
+        speed: Speech speed multiplier (default: 1.0)
+        return_all: Synthesize every segment and join them with a short
+            silence gap instead of returning only the first (default: False)
+
+    Returns:
+        Tuple of (audio tensor, phonemes string) or (None, None) on error
+    """
+    try:
+        stream = generate_speech_stream(model, text, voice, lang=lang, device=device, speed=speed)
+        if not return_all:
+            return next(stream, (None, None))
+
+        return _join_segments(list(stream))
     except (ValueError, FileNotFoundError, RuntimeError, KeyError, AttributeError, TypeError) as e:
         logger.error(f"Error generating speech: {e}")
         return None, None
@@ -674,4 +1351,203 @@ def generate_speech(
         logger.error(f"Unexpected error during speech generation: {e}")
         import traceback
         traceback.print_exc()
-        return None, None
\ No newline at end of file
+        return None, None
+
+@functools.lru_cache(maxsize=10000)
+def _phonemize_paragraph(model: EnhancedKPipeline, paragraph: str) -> Tuple[str, ...]:
+    """Phonemize one English paragraph into model-sized chunks, memoized per (pipeline, paragraph)
+
+    misaki's G2P (and its espeak-ng fallback) dominates the text-side cost,
+    so repeated prompts skip it entirely. Callers hold _synthesis_lock.
+    """
+    _, tokens = model.g2p(paragraph)
+    return tuple(ps[:510] for _, ps, _ in model.en_tokenize(tokens) if ps)
+
+def clear_phonemize_cache() -> None:
+    """Drop cached phonemization results"""
+    _phonemize_paragraph.cache_clear()
+
+def _phonemize_english(model: EnhancedKPipeline, text: str) -> List[str]:
+    """Split and phonemize English text into model-sized chunks the way KPipeline does"""
+    phoneme_chunks = []
+    for paragraph in SPLIT_PATTERN.split(text.strip()):
+        if paragraph.strip():
+            phoneme_chunks.extend(_phonemize_paragraph(model, paragraph))
+    return phoneme_chunks
+
+def _packed_lstm(lstm: torch.nn.Module, x: torch.Tensor, lengths: torch.Tensor) -> torch.Tensor:
+    """Run a batch-first LSTM over padded input without letting padding reach real steps"""
+    packed = torch.nn.utils.rnn.pack_padded_sequence(x, lengths.cpu(), batch_first=True, enforce_sorted=False)
+    out, _ = lstm(packed)
+    out, _ = torch.nn.utils.rnn.pad_packed_sequence(out, batch_first=True, total_length=x.shape[1])
+    return out
+
+def _forward_batch(kmodel: torch.nn.Module, phoneme_chunks: List[str], voice_pack: torch.Tensor,
+                   speed: float) -> List[torch.Tensor]:
+    """Synthesize several phoneme strings, batching the text-side stages
+
+    Follows KModel.forward_with_tokens step by step. Only the stages that
+    cannot see padding run on the padded batch: ALBERT (attention mask), the
+    duration encoder and text encoder (masked convolutions, packed LSTMs) and
+    the duration LSTM (packed here). The F0/N predictor and the decoder
+    normalize over the whole time axis (AdaIN) and convolve across it, so
+    padding would change every shorter item's audio; they run item by item
+    on unpadded tensors, as in single-utterance synthesis.
+
+    Args:
+        kmodel: The pipeline's KModel
+        phoneme_chunks: Phoneme strings of at most 510 symbols
+        voice_pack: Voice tensor holding one style vector per phoneme count
+        speed: Speech speed multiplier
+
+    Returns:
+        One float32 CPU waveform per phoneme string, in input order
+    """
+    device = kmodel.device
+    ids = [
+        torch.LongTensor([0, *(i for i in map(kmodel.vocab.get, ps) if i is not None), 0])
+        for ps in phoneme_chunks
+    ]
+    input_lengths = torch.tensor([len(x) for x in ids], dtype=torch.long, device=device)
+    input_ids = torch.nn.utils.rnn.pad_sequence(ids, batch_first=True).to(device)
+    positions = torch.arange(input_ids.shape[1], device=device)
+    text_mask = positions.unsqueeze(0) >= input_lengths.unsqueeze(1)
+    # The voice pack is indexed by phoneme count, so every item has its own style
+    ref_s = torch.cat([voice_pack[len(ps) - 1] for ps in phoneme_chunks]).to(device)
+
+    # Text side, batched
+    bert_dur = kmodel.bert(input_ids, attention_mask=(~text_mask).int())
+    d_en = kmodel.bert_encoder(bert_dur).transpose(-1, -2)
+    s = ref_s[:, 128:]
+    d = kmodel.predictor.text_encoder(d_en, s, input_lengths, text_mask)
+    x = _packed_lstm(kmodel.predictor.lstm, d, input_lengths)
+    duration = torch.sigmoid(kmodel.predictor.duration_proj(x)).sum(dim=-1) / speed
+    pred_dur = torch.round(duration).clamp(min=1).long()
+    t_en = kmodel.text_encoder(input_ids, input_lengths, text_mask)
+
+    # Prosody and decoder, one unpadded item at a time
+    outputs = []
+    for b, n in enumerate(input_lengths.tolist()):
+        indices = torch.repeat_interleave(positions[:n], pred_dur[b, :n])
+        pred_aln_trg = torch.zeros((1, n, indices.shape[0]), device=device, dtype=d.dtype)
+        pred_aln_trg[0, indices, torch.arange(indices.shape[0], device=device)] = 1
+        en = d[b:b + 1, :n].transpose(-1, -2) @ pred_aln_trg
+        F0_pred, N_pred = kmodel.predictor.F0Ntrain(en, s[b:b + 1])
+        asr = t_en[b:b + 1, :, :n] @ pred_aln_trg
+        audio = kmodel.decoder(asr, F0_pred, N_pred, ref_s[b:b + 1, :128]).squeeze()
+        outputs.append(audio.float().cpu())
+    return outputs
+
+def _generate_batched_forward(
+    model: EnhancedKPipeline,
+    texts: List[str],
+    voice_tensor: torch.Tensor,
+    speed: float
+) -> List[List[Tuple[torch.Tensor, str]]]:
+    """Phonemize all texts, then synthesize their chunks in length-sorted padded batches"""
+    items = [
+        (text_index, ps)
+        for text_index, text in enumerate(texts)
+        for ps in _phonemize_english(model, text)
+    ]
+    audio_by_item: List[Optional[torch.Tensor]] = [None] * len(items)
+
+    # Sorting by length keeps padding inside each batch small
+    order = sorted(range(len(items)), key=lambda i: len(items[i][1]))
+    # Same precision handling as the wrapped KModel.forward, which this path bypasses
+    if str(model.device).startswith('cuda') and model.dtype != torch.float32:
+        amp_context = torch.autocast(device_type='cuda', dtype=model.dtype)
+    else:
+        amp_context = contextlib.nullcontext()
+    with torch.inference_mode(), amp_context:
+        for start in range(0, len(order), _MAX_FORWARD_BATCH):
+            group = order[start:start + _MAX_FORWARD_BATCH]
+            outputs = _forward_batch(model.model, [items[i][1] for i in group], voice_tensor, speed)
+            for i, audio in zip(group, outputs):
+                audio_by_item[i] = audio
+
+    chunks = [[] for _ in texts]
+    for (text_index, ps), audio in zip(items, audio_by_item):
+        chunks[text_index].append((audio, ps))
+    return chunks
+
+def generate_speech_batch(
+    model: EnhancedKPipeline,
+    texts: List[str],
+    voice: Union[str, torch.Tensor],
+    lang: str = 'a',
+    device: str = 'cpu',
+    speed: float = 1.0,
+    gap_samples: int = _SEGMENT_GAP_SAMPLES
+) -> List[Tuple[Optional[torch.Tensor], Optional[str]]]:
+    """Generate speech for several utterances with one voice lookup and one pipeline pass
+
+    The voice is resolved once. For English pipelines every text is
+    phonemized first and the chunks' text-side stages run in padded batches
+    of up to _MAX_FORWARD_BATCH, with prosody and decoding per chunk (see
+    _forward_batch); other languages, int8-quantized models and a batched
+    pass that fails fall back to handing the texts' paragraphs to the
+    pipeline as one list. Each utterance is synthesized whole, with its
+    segments joined as in generate_speech(return_all=True).
+
+    Args:
+        model: EnhancedKPipeline instance
+        texts: Texts to synthesize
+        voice: Voice name (e.g. 'af_bella'), or an already loaded voice pack tensor
+        lang: Language code ('a' for American English, 'b' for British English)
+        device: Device to use ('cuda' or 'cpu')
+        speed: Speech speed multiplier (default: 1.0)
+        gap_samples: Silence inserted between a text's segments; 0 joins them
+            back to back (default: 0.1 s)
+
+    Returns:
+        One (audio tensor, phonemes string) tuple per text, in input order;
+        (None, None) for texts that produced no audio
+
+    Raises:
+        ValueError: If the model is missing or the voice cannot be loaded
+    """
+    voice_tensor = _voice_for_generation(model, voice, device)
+
+    # English pipelines expose their tokenizer, so all chunks of all texts can be
+    # phonemized up front and their text-side stages run in padded batches.
+    # Dynamic int8 layers pick one activation scale per input tensor, so a batch
+    # would change every item's quantization; those models stay sequential
+    kmodel = getattr(model, 'model', None)
+    with _synthesis_lock:
+        if model.lang_code in 'ab' and isinstance(kmodel, torch.nn.Module) and not _is_dynamic_int8(kmodel):
+            try:
+                chunks = _generate_batched_forward(model, texts, voice_tensor, speed)
+                return [_join_segments(text_chunks, gap_samples) for text_chunks in chunks]
+            except Exception as e:
+                logger.warning(f"Batched synthesis failed, generating sequentially: {e}")
+
+        # Split paragraphs as a single-text call would, remembering which text each came from
+        paragraphs, owners = [], []
+        for text_index, text in enumerate(texts):
+            for paragraph in SPLIT_PATTERN.split(text.strip()):
+                paragraphs.append(paragraph)
+                owners.append(text_index)
+
+        chunks = [[] for _ in texts]
+        for result in model(paragraphs, voice=voice_tensor, speed=speed):
+            if result.audio is not None:
+                chunks[owners[result.text_index]].append((audio_to_tensor(result.audio), result.phonemes))
+    return [_join_segments(text_chunks, gap_samples) for text_chunks in chunks]
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Kokoro TTS model utilities")
+    parser.add_argument(
+        "--migrate-voices",
+        action="store_true",
+        help="Convert all .pt voice packs in the voices directory to safetensors"
+    )
+    args = parser.parse_args()
+
+    if args.migrate_voices:
+        count = migrate_voices_to_safetensors()
+        print(f"{count} voices available in safetensors format")
+    else:
+        parser.print_help()
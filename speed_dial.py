@@ -8,42 +8,186 @@ This module provides functions to:
 - Save new presets to the JSON file
 - Delete presets from the JSON file
 - Validate preset data
+- Cache phonemes for preset texts so repeated playback skips phonemization
 """
 
+import hashlib
 import json
 import os
+import re
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+import logging
+try:
+    import orjson  # Optional C JSON library; falls back to the json module
+except ImportError:
+    orjson = None
+try:
+    import msgspec  # Optional; validates presets while parsing
+except ImportError:
+    msgspec = None
+
+logger = logging.getLogger(__name__)
 
 # Define the path for the speed dial presets file
 SPEED_DIAL_FILE = Path("speed_dial.json")
 
+# Validation patterns, compiled once; \Z (unlike $) does not match before a trailing newline
+_NAME_RE = re.compile(r'^[a-zA-Z0-9_\- ]+\Z')
+_VOICE_RE = re.compile(r'^[a-zA-Z0-9_-]+\Z')
+_ALLOWED_FORMATS = frozenset(("wav", "mp3", "aac"))
+# Fields kept in a stored preset; anything else is dropped, as the msgspec schema does
+_PRESET_FIELDS = ("voice", "text", "format", "speed", "phonemes", "text_hash")
+
+if msgspec is not None:
+    from typing import Annotated, Literal
+
+    class _Preset(msgspec.Struct):
+        """Typed preset schema mirroring validate_preset's checks"""
+        voice: Annotated[str, msgspec.Meta(pattern=_VOICE_RE.pattern)]
+        text: Annotated[str, msgspec.Meta(max_length=10000, pattern=r'\S')]
+        format: Literal["wav", "mp3", "aac"] = "wav"
+        speed: Annotated[float, msgspec.Meta(ge=0.1, le=3.0)] = 1.0
+        phonemes: Optional[str] = None
+        text_hash: Optional[str] = None
+
+    _PRESETS_DECODER = msgspec.json.Decoder(Dict[str, _Preset])
+
+def _decode_presets(data: bytes) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Parse and validate the presets file in one pass with msgspec.
+    
+    Returns:
+        Validated presets, or None if msgspec is not installed or any entry is
+        invalid, in which case the caller falls back to per-preset validation
+    """
+    if msgspec is None:
+        return None
+    try:
+        typed = _PRESETS_DECODER.decode(data)
+    except msgspec.DecodeError:
+        return None
+    
+    presets = {}
+    for name, preset in typed.items():
+        if (preset.phonemes is None) != (preset.text_hash is None):
+            return None
+        presets[name] = {"voice": preset.voice, "text": preset.text,
+                         "format": preset.format, "speed": preset.speed}
+        if preset.phonemes is not None:
+            presets[name].update(phonemes=preset.phonemes, text_hash=preset.text_hash)
+    return presets
+
+def _loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Validated presets from the last read or write, keyed on the file's mtime and size
+_CACHE = {"mtime": None, "size": None, "data": {}}
+
+def _copy_presets(presets: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Copy the presets and each preset dict, so callers and the cache never share one"""
+    return {name: dict(preset) for name, preset in presets.items()}
+
+def _write_presets(presets: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Atomically replace the presets file and refresh the cache.
+    
+    The presets are serialized once and written to a temporary file, which then
+    replaces the real one, so a crash mid-write never leaves a truncated file.
+    
+    Raises:
+        IOError: If the file cannot be written
+    """
+    data = _dumps(presets)
+    tmp_path = SPEED_DIAL_FILE.with_suffix('.json.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, SPEED_DIAL_FILE)
+    
+    # Record what was just written so the next load skips re-parsing
+    stat = SPEED_DIAL_FILE.stat()
+    _CACHE.update(mtime=stat.st_mtime_ns, size=stat.st_size, data=_copy_presets(presets))
+
 def load_presets() -> Dict[str, Dict[str, Any]]:
     """
     Load speed dial presets from the JSON file.
     
+    The parsed presets are cached and reused until the file's mtime or size changes.
+    
     Returns:
         Dictionary of presets where keys are preset names and values are preset data
     """
-    if not SPEED_DIAL_FILE.exists():
+    try:
+        stat = SPEED_DIAL_FILE.stat()
+    except FileNotFoundError:
         # If file doesn't exist, return an empty dictionary
         return {}
     
+    # Unchanged file: skip the read, parse and validation
+    if _CACHE["mtime"] == stat.st_mtime_ns and _CACHE["size"] == stat.st_size:
+        return _copy_presets(_CACHE["data"])
+    
     try:
-        with open(SPEED_DIAL_FILE, 'r', encoding='utf-8') as f:
-            presets = json.load(f)
+        with open(SPEED_DIAL_FILE, 'rb') as f:
+            data = f.read()
+        
+        # Fast path: schema-checked while parsing, no Python validation loop
+        validated_presets = _decode_presets(data)
+        if validated_presets is not None:
+            _CACHE.update(mtime=stat.st_mtime_ns, size=stat.st_size, data=validated_presets)
+            return _copy_presets(validated_presets)
+        
+        presets = _loads(data)
         
         # Validate the loaded presets
         validated_presets = {}
+        errors = []
         for name, preset in presets.items():
-            if validate_preset(preset):
-                validated_presets[name] = preset
+            valid, error = validate_preset(preset)
+            if valid:
+                validated_presets[name] = {k: preset[k] for k in _PRESET_FIELDS if k in preset}
+            else:
+                errors.append(f"{name}: {error}")
+        
+        # Report all invalid presets in one message instead of one line each
+        if errors:
+            logger.warning(f"Skipped {len(errors)} invalid speed dial presets: {'; '.join(errors[:3])}"
+                           + ("..." if len(errors) > 3 else ""))
         
-        return validated_presets
+        _CACHE.update(mtime=stat.st_mtime_ns, size=stat.st_size, data=validated_presets)
+        return _copy_presets(validated_presets)
     except (json.JSONDecodeError, IOError) as e:
         print(f"Error loading speed dial presets: {e}")
         return {}
 
+def _validate_name(name: str) -> bool:
+    """Check that a preset name is a non-empty, short string of safe characters"""
+    if not isinstance(name, str) or len(name.strip()) == 0:
+        print("Preset name must be a non-empty string")
+        return False
+    
+    if len(name) > 50:
+        print("Preset name is too long (max 50 characters)")
+        return False
+    
+    # Only allow safe characters in preset names
+    if _NAME_RE.match(name) is None:
+        print("Preset name contains invalid characters")
+        return False
+    
+    return True
+
 def save_preset(name: str, voice: str, text: str, format: str = "wav", speed: float = 1.0) -> bool:
     """
     Save a new speed dial preset.
@@ -58,44 +202,43 @@ def save_preset(name: str, voice: str, text: str, format: str = "wav", speed: fl
     Returns:
         True if successful, False otherwise
     """
-    import re
-    
-    # Validate preset name
-    if not isinstance(name, str) or len(name.strip()) == 0:
-        print("Preset name must be a non-empty string")
-        return False
-    
-    if len(name) > 50:
-        print("Preset name is too long (max 50 characters)")
-        return False
-    
-    # Only allow safe characters in preset names
-    if not re.match(r'^[a-zA-Z0-9_\- ]+$', name):
-        print("Preset name contains invalid characters")
-        return False
+    return save_presets_bulk({name: {"voice": voice, "text": text, "format": format, "speed": speed}})
+
+def save_presets_bulk(updates: Dict[str, Dict[str, Any]]) -> bool:
+    """
+    Add or update several presets with a single load and a single write.
     
-    # Create preset data
-    preset = {
-        "voice": voice,
-        "text": text,
-        "format": format,
-        "speed": speed
-    }
+    Either every preset is saved or none is: if any name or preset fails
+    validation, the file is left untouched.
     
-    # Validate preset data
-    if not validate_preset(preset):
-        return False
+    Args:
+        updates: Dictionary of preset names to preset data ("voice", "text",
+            and optionally "format" and "speed")
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    # Validate every name and preset before touching the file
+    validated = {}
+    for name, preset in updates.items():
+        if not _validate_name(name):
+            return False
+        preset = dict(preset)
+        valid, error = validate_preset(preset)
+        if not valid:
+            print(f"Invalid preset '{name}': {error}")
+            return False
+        validated[name] = {k: preset[k] for k in _PRESET_FIELDS if k in preset}
     
     # Load existing presets
     presets = load_presets()
     
-    # Add or update the preset
-    presets[name] = preset
+    # Add or update the presets
+    presets.update(validated)
     
     # Save presets to file
     try:
-        with open(SPEED_DIAL_FILE, 'w', encoding='utf-8') as f:
-            json.dump(presets, f, indent=2, ensure_ascii=False)
+        _write_presets(presets)
         return True
     except IOError as e:
         print(f"Error saving speed dial preset: {e}")
@@ -111,68 +254,78 @@ def delete_preset(name: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    return delete_presets_bulk([name]) == 1
+
+def delete_presets_bulk(names: List[str]) -> int:
+    """
+    Delete several presets with a single load and a single write.
+    
+    Args:
+        names: Names of the presets to delete; names that do not exist are ignored
+        
+    Returns:
+        Number of presets deleted (0 if none existed or the write failed)
+    """
     # Load existing presets
     presets = load_presets()
     
-    # Check if preset exists
-    if name not in presets:
-        return False
+    # Remove the presets that exist
+    deleted = 0
+    for name in names:
+        if presets.pop(name, None) is not None:
+            deleted += 1
     
-    # Remove the preset
-    del presets[name]
+    if deleted == 0:
+        return 0
     
     # Save presets to file
     try:
-        with open(SPEED_DIAL_FILE, 'w', encoding='utf-8') as f:
-            json.dump(presets, f, indent=2, ensure_ascii=False)
-        return True
+        _write_presets(presets)
+        return deleted
     except IOError as e:
         print(f"Error deleting speed dial preset: {e}")
-        return False
+        return 0
 
-def validate_preset(preset: Dict[str, Any]) -> bool:
+def validate_preset(preset: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     """
     Validate a preset's data structure with security checks.
     
+    Nothing is printed; callers decide whether and how to report the error.
+    
     Args:
         preset: Preset data to validate
         
     Returns:
-        True if valid, False otherwise
+        Tuple of (True, None) if valid, or (False, error message) otherwise
     """
-    import re
+    if not isinstance(preset, dict):
+        return False, "Preset must be an object"
     
     # Check required fields
     required_fields = ["voice", "text"]
     for field in required_fields:
         if field not in preset:
-            print(f"Preset missing required field: {field}")
-            return False
+            return False, f"Preset missing required field: {field}"
     
     # Check field types and validate content
     voice = preset.get("voice")
     if not isinstance(voice, str):
-        print("Preset voice must be a string")
-        return False
+        return False, "Preset voice must be a string"
     
     # Validate voice name (alphanumeric, underscore, dash only)
-    if not re.match(r'^[a-zA-Z0-9_-]+$', voice):
-        print("Preset voice contains invalid characters")
-        return False
+    if _VOICE_RE.match(voice) is None:
+        return False, "Preset voice contains invalid characters"
     
     text = preset.get("text")
     if not isinstance(text, str):
-        print("Preset text must be a string")
-        return False
+        return False, "Preset text must be a string"
     
     # Validate text length and content
     if len(text) > 10000:
-        print("Preset text is too long (max 10,000 characters)")
-        return False
+        return False, "Preset text is too long (max 10,000 characters)"
     
     if len(text.strip()) == 0:
-        print("Preset text cannot be empty")
-        return False
+        return False, "Preset text cannot be empty"
     
     # Optional fields with validation
     if "format" not in preset:
@@ -180,26 +333,29 @@ def validate_preset(preset: Dict[str, Any]) -> bool:
     else:
         format_val = preset["format"]
         if not isinstance(format_val, str):
-            print("Preset format must be a string")
-            return False
+            return False, "Preset format must be a string"
         # Only allow safe audio formats
-        if format_val not in ["wav", "mp3", "aac"]:
-            print("Preset format must be wav, mp3, or aac")
-            return False
+        if format_val not in _ALLOWED_FORMATS:
+            return False, "Preset format must be wav, mp3, or aac"
     
     if "speed" not in preset:
         preset["speed"] = 1.0
     else:
         speed = preset["speed"]
-        if not isinstance(speed, (int, float)):
-            print("Preset speed must be a number")
-            return False
+        # bool is a subclass of int but not a valid speed
+        if not isinstance(speed, (int, float)) or isinstance(speed, bool):
+            return False, "Preset speed must be a number"
         # Validate speed range
         if speed < 0.1 or speed > 3.0:
-            print("Preset speed must be between 0.1 and 3.0")
-            return False
+            return False, "Preset speed must be between 0.1 and 3.0"
+        preset["speed"] = float(speed)
     
-    return True
+    # Cached phonemes are optional but must come with the hash they were computed for
+    if "phonemes" in preset or "text_hash" in preset:
+        if not isinstance(preset.get("phonemes"), str) or not isinstance(preset.get("text_hash"), str):
+            return False, "Preset phonemes and text_hash must both be strings"
+    
+    return True, None
 
 def get_preset_names() -> List[str]:
     """
@@ -223,3 +379,63 @@ def get_preset(name: str) -> Optional[Dict[str, Any]]:
     """
     presets = load_presets()
     return presets.get(name)
+
+def phoneme_key(voice: str, text: str) -> str:
+    """
+    Hash identifying the phonemization of a text for a voice's language.
+    
+    The first letter of a voice name is its language code, so voices of the
+    same language share phonemes.
+    
+    Args:
+        voice: Voice name (e.g. "af_bella")
+        text: Text to convert to speech
+        
+    Returns:
+        Hex digest stored in a preset's "text_hash" field
+    """
+    return hashlib.blake2b(f"{voice[:1]}\0{text}".encode('utf-8'), digest_size=8).hexdigest()
+
+def get_cached_phonemes(voice: str, text: str) -> Optional[List[str]]:
+    """
+    Get cached phonemes for a voice and text from any preset that stores them.
+    
+    Args:
+        voice: Voice name
+        text: Text to convert to speech
+        
+    Returns:
+        One phoneme string per generated segment, or None if nothing is cached
+    """
+    key = phoneme_key(voice, text)
+    for preset in load_presets().values():
+        # A hash mismatch means the text or language changed since caching
+        if preset.get("text_hash") == key and preset["text"] == text:
+            return preset["phonemes"].split("\n")
+    return None
+
+def store_phonemes(voice: str, text: str, phonemes: List[str]) -> bool:
+    """
+    Cache phonemes on every preset with this text and voice language.
+    
+    Texts that no preset uses are not stored, and the file is only written
+    when at least one preset was updated.
+    
+    Args:
+        voice: Voice name
+        text: Text that was converted to speech
+        phonemes: One phoneme string per generated segment
+        
+    Returns:
+        True if any preset was updated, False otherwise
+    """
+    key = phoneme_key(voice, text)
+    updates = {
+        name: dict(preset, phonemes="\n".join(phonemes), text_hash=key)
+        for name, preset in load_presets().items()
+        if preset["text"] == text and phoneme_key(preset["voice"], text) == key
+        and preset.get("text_hash") != key
+    }
+    if not updates:
+        return False
+    return save_presets_bulk(updates)
@@ -4,14 +4,25 @@ API测试脚本
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+# 复用连接池，避免每个请求重新建立TCP连接
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+# 普通请求的超时（秒）
+REQUEST_TIMEOUT = 30
+# 合成请求的读取超时（秒）：CPU上多个请求排队合成时可能远超30秒，可通过环境变量调整
+SYNTHESIS_TIMEOUT = (10, float(os.environ.get("KOKORO_TEST_TIMEOUT", "600")))
 
 def test_api_health():
     """测试API健康检查"""
     try:
-        response = requests.get("http://localhost:8000/health")
+        response = SESSION.get("http://localhost:8000/health", timeout=REQUEST_TIMEOUT)
         if response.status_code == 200:
             print("✅ API健康检查通过")
             return True
@@ -25,7 +36,7 @@ def test_api_health():
 def test_get_voices():
     """测试获取语音列表"""
     try:
-        response = requests.get("http://localhost:8000/voices")
+        response = SESSION.get("http://localhost:8000/voices", timeout=REQUEST_TIMEOUT)
         if response.status_code == 200:
             voices = response.json()
             print(f"✅ 获取语音列表成功，共{len(voices)}个语音")
@@ -57,16 +68,19 @@ def test_tts_file():
     }
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             "http://localhost:8000/tts/file",
             json=data,
-            headers={"Content-Type": "application/json"}
+            timeout=SYNTHESIS_TIMEOUT,
+            stream=True
         )
         
         if response.status_code == 200:
             filename = "test_output.wav"
+            # 分块写入磁盘，避免整个音频缓存在内存中
             with open(filename, "wb") as f:
-                f.write(response.content)
+                for chunk in response.iter_content(chunk_size=65536):
+                    f.write(chunk)
             print(f"✅ 音频文件生成成功: {filename}")
             return True
         else:
@@ -89,16 +103,19 @@ def test_tts_data():
     }
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             "http://localhost:8000/tts/data",
             json=data,
-            headers={"Content-Type": "application/json"}
+            timeout=SYNTHESIS_TIMEOUT,
+            stream=True
         )
         
         if response.status_code == 200:
             filename = "test_stream.mp3"
+            # 分块写入磁盘，避免整个音频缓存在内存中
             with open(filename, "wb") as f:
-                f.write(response.content)
+                for chunk in response.iter_content(chunk_size=65536):
+                    f.write(chunk)
             print(f"✅ 音频数据流生成成功: {filename}")
             return True
         else:
@@ -122,10 +139,10 @@ def test_tts_save():
     }
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             "http://localhost:8000/tts/save",
             json=data,
-            headers={"Content-Type": "application/json"}
+            timeout=SYNTHESIS_TIMEOUT
         )
         
         if response.status_code == 200:
@@ -152,10 +169,10 @@ def test_error_cases():
     }
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             "http://localhost:8000/tts/file",
             json=data,
-            headers={"Content-Type": "application/json"}
+            timeout=REQUEST_TIMEOUT
         )
         
         if response.status_code == 400:
@@ -182,10 +199,10 @@ def run_all_tests():
     # 运行功能测试
     print("\n🎯 运行功能测试...")
     
-    test_results = []
-    test_results.append(test_tts_file())
-    test_results.append(test_tts_data())
-    test_results.append(test_tts_save())
+    # 三个功能测试互不依赖，并发执行，总耗时取决于最慢的一个
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(test) for test in (test_tts_file, test_tts_data, test_tts_save)]
+        test_results = [future.result() for future in futures]
     
     # 测试错误情况
     test_error_cases()
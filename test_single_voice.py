@@ -9,137 +9,167 @@ import json
 import os
 from pathlib import Path
 
+try:
+    import aiofiles  # 可选依赖：异步写文件
+except ImportError:
+    aiofiles = None
+
 # API服务器地址
 API_BASE_URL = "http://localhost:8000"
+# 保存响应时每次读取的块大小
+CHUNK_SIZE = 65536
 
-async def test_multiple_single_voices():
-    """测试多个单个朗读者轮流使用功能"""
+async def save_response(response: aiohttp.ClientResponse, filename: str):
+    """将响应体分块写入文件，不在内存中缓存整个音频，也不阻塞事件循环"""
+    if aiofiles is not None:
+        async with aiofiles.open(filename, 'wb') as f:
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                await f.write(chunk)
+        return
     
-    async with aiohttp.ClientSession() as session:
-        print("=== 测试多个朗读者轮流使用功能 ===")
-        
-        # 测试文本
-        text = "Hello, this is a test of multiple voice selection."
-        
-        # 定义多个朗读者
-        voices = ["af_bella", "af_nicole", "am_adam"]
-        
-        print(f"测试文本: {text}")
-        print(f"朗读者列表: {voices}")
-        print("注意: 朗读者选择现在由前端JS完成，这里模拟前端随机选择")
-        print()
-        
-        # 测试多次调用，使用不同的朗读者
-        for i, voice in enumerate(voices):
-            print(f"测试 {i+1} - 使用朗读者: {voice}:")
-            
-            # 准备请求数据（单个voice）
-            payload = {
-                "text": text,
-                "voice": voice,
-                "speed": 1.0,
-                "format": "wav"
-            }
-            
-            try:
-                # 调用API
-                async with session.post(f"{API_BASE_URL}/tts/data", json=payload) as response:
-                    if response.status == 200:
-                        # 获取响应头中的信息
-                        content_disposition = response.headers.get('Content-Disposition', '')
-                        print(f"  响应状态: 200 OK")
-                        print(f"  Content-Disposition: {content_disposition}")
-                        
-                        # 保存音频文件
-                        filename = f"test_multi_voices_{i+1}.wav"
-                        with open(filename, 'wb') as f:
-                            f.write(await response.read())
-                        print(f"  音频已保存: {filename}")
-                        
-                    else:
-                        error_text = await response.text()
-                        print(f"  响应状态: {response.status}")
-                        print(f"  错误信息: {error_text}")
-                        
-            except Exception as e:
-                print(f"  错误: {str(e)}")
-            
-            print()
+    # 未安装aiofiles时，把同步写操作放到工作线程
+    f = await asyncio.to_thread(open, filename, 'wb')
+    try:
+        async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+            await asyncio.to_thread(f.write, chunk)
+    finally:
+        await asyncio.to_thread(f.close)
 
-async def test_single_voice():
-    """测试单个朗读者（向后兼容）"""
+async def test_multiple_single_voices(session: aiohttp.ClientSession):
+    """测试多个单个朗读者轮流使用功能"""
     
-    async with aiohttp.ClientSession() as session:
-        print("=== 测试单个朗读者（向后兼容） ===")
+    print("=== 测试多个朗读者轮流使用功能 ===")
+    
+    # 测试文本
+    text = "Hello, this is a test of multiple voice selection."
+    
+    # 定义多个朗读者
+    voices = ["af_bella", "af_nicole", "am_adam"]
+    
+    print(f"测试文本: {text}")
+    print(f"朗读者列表: {voices}")
+    print("注意: 朗读者选择现在由前端JS完成，这里模拟前端随机选择")
+    print()
+    
+    # 限制并发数，避免压垮TTS服务
+    semaphore = asyncio.Semaphore(4)
+    
+    async def _one(i: int, voice: str) -> list:
+        """发送一次请求，返回该请求的输出行（并发执行时按顺序统一打印）"""
+        lines = [f"测试 {i+1} - 使用朗读者: {voice}:"]
         
+        # 准备请求数据（单个voice）
         payload = {
-            "text": "This is a test with single voice selection.",
-            "voice": "af_bella",  # 使用单个voice参数
+            "text": text,
+            "voice": voice,
             "speed": 1.0,
             "format": "wav"
         }
         
         try:
-            async with session.post(f"{API_BASE_URL}/tts/data", json=payload) as response:
+            # 调用API
+            async with semaphore, session.post(f"{API_BASE_URL}/tts/data", json=payload) as response:
                 if response.status == 200:
-                    filename = "test_single_voice.wav"
-                    with open(filename, 'wb') as f:
-                        f.write(await response.read())
-                    print(f"音频已保存: {filename}")
+                    # 获取响应头中的信息
+                    content_disposition = response.headers.get('Content-Disposition', '')
+                    lines.append(f"  响应状态: 200 OK")
+                    lines.append(f"  Content-Disposition: {content_disposition}")
+                    
+                    # 保存音频文件
+                    filename = f"test_multi_voices_{i+1}.wav"
+                    await save_response(response, filename)
+                    lines.append(f"  音频已保存: {filename}")
+                    
                 else:
                     error_text = await response.text()
-                    print(f"错误: {response.status} - {error_text}")
+                    lines.append(f"  响应状态: {response.status}")
+                    lines.append(f"  错误信息: {error_text}")
                     
         except Exception as e:
-            print(f"错误: {str(e)}")
+            lines.append(f"  错误: {str(e)}")
         
+        return lines
+    
+    # 并发调用，使用不同的朗读者
+    results = await asyncio.gather(*[_one(i, voice) for i, voice in enumerate(voices)])
+    for lines in results:
+        print("\n".join(lines))
         print()
 
-async def test_invalid_voice():
-    """测试无效朗读者处理"""
+async def test_single_voice(session: aiohttp.ClientSession):
+    """测试单个朗读者（向后兼容）"""
     
-    async with aiohttp.ClientSession() as session:
-        print("=== 测试无效朗读者处理 ===")
-        
-        payload = {
-            "text": "Test with invalid voice.",
-            "voice": "invalid_voice",
-            "speed": 1.0,
-            "format": "wav"
-        }
-        
-        try:
-            async with session.post(f"{API_BASE_URL}/tts/data", json=payload) as response:
+    print("=== 测试单个朗读者（向后兼容） ===")
+    
+    payload = {
+        "text": "This is a test with single voice selection.",
+        "voice": "af_bella",  # 使用单个voice参数
+        "speed": 1.0,
+        "format": "wav"
+    }
+    
+    try:
+        async with session.post(f"{API_BASE_URL}/tts/data", json=payload) as response:
+            if response.status == 200:
+                filename = "test_single_voice.wav"
+                await save_response(response, filename)
+                print(f"音频已保存: {filename}")
+            else:
                 error_text = await response.text()
-                print(f"响应状态: {response.status}")
-                print(f"错误信息: {error_text}")
+                print(f"错误: {response.status} - {error_text}")
                 
-        except Exception as e:
-            print(f"错误: {str(e)}")
-        
-        print()
+    except Exception as e:
+        print(f"错误: {str(e)}")
+    
+    print()
+
+async def test_invalid_voice(session: aiohttp.ClientSession):
+    """测试无效朗读者处理"""
+    
+    print("=== 测试无效朗读者处理 ===")
+    
+    payload = {
+        "text": "Test with invalid voice.",
+        "voice": "invalid_voice",
+        "speed": 1.0,
+        "format": "wav"
+    }
+    
+    try:
+        async with session.post(f"{API_BASE_URL}/tts/data", json=payload) as response:
+            error_text = await response.text()
+            print(f"响应状态: {response.status}")
+            print(f"错误信息: {error_text}")
+            
+    except Exception as e:
+        print(f"错误: {str(e)}")
+    
+    print()
 
 
 
 async def main():
     """主测试函数"""
     
-    # 检查API服务器是否运行
-    try:
-        async with aiohttp.ClientSession() as session:
+    # 所有测试共用一个会话，复用连接池；保持长连接，避免每个请求重新建立TCP连接
+    connector = aiohttp.TCPConnector(limit=256, limit_per_host=256, keepalive_timeout=60, enable_cleanup_closed=True)
+    timeout = aiohttp.ClientTimeout(total=120)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        # 检查API服务器是否运行
+        try:
             async with session.get(f"{API_BASE_URL}/health") as response:
                 if response.status != 200:
                     print("警告: API服务器可能未运行，请确保 tts_api.py 正在运行")
                     return
-    except Exception as e:
-        print(f"错误: 无法连接到API服务器，请确保 tts_api.py 正在运行")
-        print(f"错误详情: {str(e)}")
-        return
-    
-    # 运行所有测试
-    await test_multiple_single_voices()
-    await test_single_voice()
-    await test_invalid_voice()
+        except Exception as e:
+            print(f"错误: 无法连接到API服务器，请确保 tts_api.py 正在运行")
+            print(f"错误详情: {str(e)}")
+            return
+        
+        # 运行所有测试
+        await test_multiple_single_voices(session)
+        await test_single_voice(session)
+        await test_invalid_voice(session)
     
     print("所有测试完成！")
     print("生成的测试文件:")
@@ -17,8 +17,12 @@ def test_volume_enhancer():
     duration = 1.0
     frequency = 440
     
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    test_audio = 0.5 * np.sin(2 * np.pi * frequency * t).astype(np.float32)
+    # 全程使用float32单个缓冲区原地计算，避免float64临时数组和类型转换
+    n = int(sample_rate * duration)
+    phase = np.arange(n, dtype=np.float32)
+    phase *= np.float32(2 * np.pi * frequency / sample_rate)
+    test_audio = np.sin(phase, out=phase)
+    test_audio *= np.float32(0.5)
     
     print(f"原始音频数据类型: {test_audio.dtype}")
     print(f"原始音频范围: [{test_audio.min():.4f}, {test_audio.max():.4f}]")
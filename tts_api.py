@@ -5,30 +5,39 @@ Kokoro TTS API Server
 
 import os
 import io
-import tempfile
+import struct
 import asyncio
 import random
 import hashlib
 from typing import Optional, List
+from collections import OrderedDict
 from pathlib import Path
 import torch
 import numpy as np
 import soundfile as sf
 from fastapi import FastAPI, HTTPException, UploadFile, File
-from fastapi.responses import FileResponse, StreamingResponse, JSONResponse
+from fastapi.responses import Response, StreamingResponse, JSONResponse, ORJSONResponse
 from pydantic import BaseModel, Field, field_validator
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 import uvicorn
 import logging
-from datetime import datetime
 from fastapi.middleware.cors import CORSMiddleware
 import sys
 
+try:
+    import orjson  # 可选依赖：更快的JSON序列化
+except ImportError:
+    orjson = None
+
 # 导入音量增强器
-sys.path.append(str(Path(__file__).parent))
+# 仅在脚本目录不在搜索路径中时才添加，避免重复条目拉长后续每次导入的查找链
+_SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPT_DIR not in sys.path:
+    sys.path.append(_SCRIPT_DIR)
 from volume_enhancer import enhance_tts_audio
 
-from models import build_model, generate_speech, list_available_voices
+from models import build_model, generate_speech_stream, generate_speech_batch, list_available_voices, wait_for_voice_preload
 from config import TTSConfig
 
 # 配置日志
@@ -40,9 +49,20 @@ async def lifespan(app: FastAPI):
     """应用生命周期管理"""
     # 启动时执行
     logger.info("Starting Kokoro TTS API server...")
+    # 推理在默认线程池中执行；共享管线的每个合成步骤由models中的锁串行化，
+    # 多个线程使语音加载、增益和编码可以与另一请求的合成重叠
+    max_workers = max(1, int(config.get("model.max_concurrency", 2)))
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tts-inference")
+    )
+    refresh_voice_set()
     try:
         await get_model()
         logger.info("Model preloaded successfully")
+        # build_model已用一次空合成预热推理内核，并在后台线程中预加载语音张量；
+        # 等待预加载完成后再接受请求，首个请求无需读盘
+        loaded = await asyncio.to_thread(wait_for_voice_preload)
+        logger.info(f"Preloaded {loaded} voices")
     except Exception as e:
         logger.error(f"Failed to preload model: {e}")
     
@@ -54,7 +74,7 @@ async def lifespan(app: FastAPI):
         try:
             del model
             model = None
-            if torch.cuda.is_available():
+            if HAS_CUDA:
                 torch.cuda.empty_cache()
             logger.info("Model resources cleaned up")
         except Exception as e:
@@ -65,7 +85,9 @@ app = FastAPI(
     title="Kokoro TTS API",
     description="文本转语音API服务，支持多种语音和语言",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # 安装了orjson时用它序列化JSON响应，否则使用标准库
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse
 )
 
 # 配置CORS
@@ -81,6 +103,56 @@ app.add_middleware(
 config = TTSConfig()
 model = None
 model_lock = asyncio.Lock()
+# CUDA可用性在导入时检测一次，之后直接复用
+HAS_CUDA = torch.cuda.is_available()
+DEVICE = 'cuda' if HAS_CUDA else 'cpu'
+# 语音目录，启动时解析一次，避免每个请求重复查询配置和拼接路径
+VOICES_DIR = Path(config.get("paths.voices_dir"))
+# 可用语音名称集合，启动时扫描一次，请求校验时无需访问文件系统
+VOICE_SET: frozenset = frozenset()
+# 流式WAV中未知长度的占位值（RIFF与data块大小）
+WAV_STREAM_SIZE = 0xFFFFFFFF
+# 已编码音频缓存的总字节上限
+AUDIO_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+class AudioCache:
+    """按总字节数限制的LRU缓存，保存已编码的音频文件内容
+    
+    只在事件循环线程中访问，读写之间没有await，因此无需加锁
+    """
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+    
+    @staticmethod
+    def make_key(text: str, voice: str, speed: float, sample_rate: int, format: str, volume_gain: float) -> bytes:
+        """根据所有影响输出的参数生成缓存键"""
+        content = f"{text}\0{voice}\0{speed:.3f}\0{sample_rate}\0{format}\0{volume_gain:.2f}"
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+    
+    def get(self, key: bytes) -> Optional[bytes]:
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+        return data
+    
+    def put(self, key: bytes, data: bytes):
+        # 单个条目超过总上限时不缓存
+        if len(data) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.total_bytes -= len(old)
+        self._entries[key] = data
+        self.total_bytes += len(data)
+        # 淘汰最久未使用的条目
+        while self.total_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.total_bytes -= len(evicted)
+
+audio_cache = AudioCache(AUDIO_CACHE_MAX_BYTES)
 
 # 请求模型
 class TTSRequest(BaseModel):
@@ -93,7 +165,8 @@ class TTSRequest(BaseModel):
 
     @field_validator('format')
     def validate_format(cls, v):
-        supported_formats = {'wav', 'flac', 'ogg', 'mp3', 'aiff', 'au', 'caf', 'w64'}
+        # pcm: 无文件头的16位小端单声道PCM，供WebAudio等客户端直接解码
+        supported_formats = {'wav', 'flac', 'ogg', 'mp3', 'aiff', 'au', 'caf', 'w64', 'pcm'}
         if v.lower() not in supported_formats:
             raise ValueError(f'不支持的音频格式: {v}。支持的格式: {", ".join(supported_formats)}')
         return v.lower()
@@ -103,28 +176,99 @@ class VoiceInfo(BaseModel):
     language: str
     gender: str
 
+# 语音名称首字母对应的语言
+LANGUAGE_MAP = {
+    'a': 'American English',
+    'b': 'British English',
+    'j': 'Japanese',
+    'z': 'Mandarin Chinese',
+    'e': 'Spanish',
+    'f': 'French',
+    'h': 'Hindi',
+    'i': 'Italian',
+    'p': 'Brazilian Portuguese'
+}
+
+# 语音名称第二个字母对应的性别
+GENDER_MAP = {'f': 'Female', 'm': 'Male'}
+
 # 辅助函数
 async def get_model():
-    """获取或初始化模型"""
+    """获取或初始化模型
+    
+    模型通常已在启动时加载，此时直接返回，不获取锁；
+    只有启动加载失败后才会在请求中重试初始化
+    """
     global model
-    if model is None:
-        async with model_lock:
-            if model is None:  # 双重检查
-                try:
-                    device = 'cuda' if torch.cuda.is_available() else 'cpu'
-                    logger.info(f"Initializing model on device: {device}")
-                    model = build_model(config.get("model.default_model_path"), device)
-                    logger.info("Model initialized successfully")
-                except Exception as e:
-                    logger.error(f"Failed to initialize model: {e}")
-                    raise HTTPException(status_code=500, detail=f"模型初始化失败: {str(e)}")
+    if model is not None:
+        return model
+    
+    async with model_lock:
+        if model is None:  # 双重检查
+            try:
+                logger.info(f"Initializing model on device: {DEVICE}")
+                # 加载和预热需要数秒，放到工作线程，期间事件循环仍可响应其他请求
+                model = await asyncio.to_thread(
+                    build_model,
+                    config.get("model.default_model_path"),
+                    DEVICE,
+                    dtype=config.get("model.dtype", "fp32"),
+                    compile_model=config.get("model.compile", False),
+                    quantize=config.get("model.quantize")
+                )
+                logger.info("Model initialized successfully")
+            except Exception as e:
+                logger.error(f"Failed to initialize model: {e}")
+                raise HTTPException(status_code=500, detail=f"模型初始化失败: {str(e)}")
     return model
 
+def build_voice_info(voices: List[str]) -> List["VoiceInfo"]:
+    """根据语音名称解析语言和性别信息"""
+    voice_info_list = []
+    
+    for voice in voices:
+        # 解析语音名称格式
+        parts = voice.split('_')
+        if len(parts) >= 2:
+            lang_code = parts[0][0]  # 第一个字母
+            gender = parts[0][1]     # 第二个字母
+            
+            voice_info = VoiceInfo(
+                name=voice,
+                language=LANGUAGE_MAP.get(lang_code, 'Unknown'),
+                gender=GENDER_MAP.get(gender, 'Unknown')
+            )
+            voice_info_list.append(voice_info)
+    
+    return voice_info_list
+
+def refresh_voice_set() -> frozenset:
+    """扫描语音目录，更新可用语音名称集合和语音信息列表"""
+    global VOICE_SET
+    voices = list_available_voices(force_refresh=True)
+    VOICE_SET = frozenset(voices)
+    # /voices 直接返回这份预先生成的列表
+    app.state.voice_info = build_voice_info(voices)
+    return VOICE_SET
+
 def validate_voice(voice_name: str) -> bool:
     """验证语音文件是否存在"""
-    voices_dir = Path(config.get("paths.voices_dir"))
-    voice_path = voices_dir / f"{voice_name}.pt"
-    return voice_path.exists()
+    if voice_name in VOICE_SET:
+        return True
+    # 未命中时再检查一次磁盘，兼容服务启动后新增的语音文件
+    if (VOICES_DIR / f"{voice_name}.pt").exists():
+        refresh_voice_set()
+        return True
+    return False
+
+def get_voice(model_instance, voice_name: str) -> torch.Tensor:
+    """获取已加载的语音张量
+    
+    管线按语音名称缓存张量（CUDA上使用锁页内存异步拷贝到设备），
+    之后的请求直接复用，不再重复读取和反序列化.pt文件；
+    首次加载在管线锁内进行，不会与后台预加载重复读取同一语音
+    """
+    return model_instance.load_voice(str(VOICES_DIR / f"{voice_name}.pt"))
 
 def select_voice_from_request(request: TTSRequest) -> str:
     """根据请求选择语音"""
@@ -154,43 +298,133 @@ def generate_sha1_filename(text: str, voice: str, speed: float, format: str) ->
     # 返回格式化的文件名
     return f"tts_{sha1_hash[:12]}.{format}"
 
+def _generate_sync(model_instance, text: str, voice: str, speed: float, volume_gain: float = 0.0) -> np.ndarray:
+    """同步生成完整音频（在工作线程中运行）"""
+    voice_pack = get_voice(model_instance, voice)
+    
+    # 完整音频不需要逐段返回，整段文本交给批量合成：英文管线各片段的文本侧计算合并为批次，
+    # 片段之间与流式输出一样不插入静音
+    [(final_audio, _)] = generate_speech_batch(
+        model_instance, [text], voice_pack, device=DEVICE, speed=speed, gap_samples=0
+    )
+    
+    if final_audio is None:
+        raise HTTPException(status_code=500, detail="音频生成失败")
+    
+    audio_data = final_audio.float().numpy()
+    
+    # 应用音量增益
+    if volume_gain != 0.0:
+        audio_data = enhance_tts_audio(audio_data, volume_gain)
+    
+    return audio_data
+
 async def generate_audio(text: str, voice: str, speed: float, sample_rate: int, volume_gain: float = 0.0) -> np.ndarray:
     """生成音频数据"""
     model_instance = await get_model()
     
-    voices_dir = Path(config.get("paths.voices_dir"))
-    voice_path = voices_dir / f"{voice}.pt"
+    try:
+        # 推理、拼接和转换都是同步计算，放到工作线程，避免阻塞事件循环上的其他请求
+        return await asyncio.to_thread(_generate_sync, model_instance, text, voice, speed, volume_gain)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error generating audio: {e}")
+        raise HTTPException(status_code=500, detail=f"音频生成失败: {str(e)}")
+
+def wav_stream_header(sample_rate: int, channels: int = 1, bits_per_sample: int = 16, data_size: int = WAV_STREAM_SIZE) -> bytes:
+    """生成44字节的WAV头，数据长度未知（流式输出）时使用0xFFFFFFFF占位"""
+    byte_rate = sample_rate * channels * bits_per_sample // 8
+    block_align = channels * bits_per_sample // 8
+    riff_size = WAV_STREAM_SIZE if data_size == WAV_STREAM_SIZE else 36 + data_size
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', riff_size, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate, byte_rate, block_align, bits_per_sample,
+        b'data', data_size
+    )
+
+def audio_to_pcm16(audio: torch.Tensor) -> bytes:
+    """将浮点音频量化为16位小端PCM字节"""
+    # clamp生成唯一的临时张量，其余步骤原地完成；若张量在GPU上，先量化再拷回，传输量减半
+    pcm = audio.clamp(-1.0, 1.0).mul_(32767).to(torch.int16)
+    return pcm.cpu().numpy().tobytes()
+
+def audio_media_type(format: str, sample_rate: int) -> str:
+    """返回音频格式对应的Content-Type"""
+    if format == 'pcm':
+        return f"audio/L16; rate={sample_rate}; channels=1"
+    return f"audio/{format}"
+
+def encode_audio(audio_data: np.ndarray, sample_rate: int, format: str) -> bytes:
+    """将音频编码为指定格式的字节内容"""
+    if format in ('pcm', 'wav'):
+        # 原始PCM无需经过libsndfile编码；WAV只是在前面加上44字节文件头，
+        # 大小预先确定，避免BytesIO在写入过程中反复扩容拷贝
+        pcm = audio_to_pcm16(torch.from_numpy(audio_data))
+        if format == 'wav':
+            return wav_stream_header(sample_rate, data_size=len(pcm)) + pcm
+        return pcm
+    buffer = io.BytesIO()
+    sf.write(buffer, audio_data, sample_rate, format=format)
+    return buffer.getvalue()
+
+async def audio_chunk_iter(model_instance, text: str, voice: str, speed: float, sample_rate: int, volume_gain: float = 0.0, cache_key: Optional[bytes] = None, wav_header: bool = True):
+    """逐段生成音频，先输出WAV头（wav_header为False时输出原始PCM），再输出每个片段的16位PCM数据
     
+    指定cache_key时，完整生成后把带准确长度的内容写入缓存
+    """
+    if wav_header:
+        yield wav_stream_header(sample_rate)
+    
+    pcm_chunks = []
+    generator = None
+    pending = None
     try:
-        # 生成语音
-        all_audio = []
-        generator = model_instance(text, voice=str(voice_path), speed=speed, split_pattern=r'\n+')
-        
-        for gs, ps, audio in generator:
-            if audio is not None:
-                audio_tensor = audio if isinstance(audio, torch.Tensor) else torch.from_numpy(audio).float()
-                all_audio.append(audio_tensor)
-        
-        if not all_audio:
-            raise HTTPException(status_code=500, detail="音频生成失败")
-        
-        # 合并音频片段
-        if len(all_audio) == 1:
-            final_audio = all_audio[0]
-        else:
-            final_audio = torch.cat(all_audio, dim=0)
-        
-        audio_data = final_audio.numpy()
+        # 首次使用某个语音时需要读盘，同样放到工作线程
+        voice_pack = await asyncio.to_thread(get_voice, model_instance, voice)
+        generator = generate_speech_stream(model_instance, text, voice_pack, device=DEVICE, speed=speed)
         
-        # 应用音量增益
-        if volume_gain != 0.0:
-            audio_data = enhance_tts_audio(audio_data, volume_gain)
-        
-        return audio_data
+        # 在工作线程中推进生成器，避免推理阻塞事件循环
+        pending = asyncio.ensure_future(asyncio.to_thread(next, generator, None))
+        while True:
+            # shield：请求被取消时工作线程仍在运行，需保留任务以便在finally中等待
+            result = await asyncio.shield(pending)
+            pending = None
+            if result is None:
+                break
+            
+            # 先开始合成下一段，再处理和发送当前段，让推理与网络传输重叠
+            pending = asyncio.ensure_future(asyncio.to_thread(next, generator, None))
+            
+            audio, ps = result
+            # 增益是逐样本的线性运算，可以按片段应用
+            if volume_gain != 0.0:
+                audio = torch.from_numpy(enhance_tts_audio(audio.numpy(), volume_gain))
+            
+            pcm = audio_to_pcm16(audio)
+            if cache_key is not None:
+                pcm_chunks.append(pcm)
+            yield pcm
         
+        # 只缓存完整生成的音频，出错或客户端断开时不写入
+        if cache_key is not None and pcm_chunks:
+            data = b''.join(pcm_chunks)
+            if wav_header:
+                data = wav_stream_header(sample_rate, data_size=len(data)) + data
+            audio_cache.put(cache_key, data)
     except Exception as e:
-        logger.error(f"Error generating audio: {e}")
-        raise HTTPException(status_code=500, detail=f"音频生成失败: {str(e)}")
+        # 响应头已发送，只能记录错误并提前结束流
+        logger.error(f"Error streaming audio: {e}")
+    finally:
+        # 生成器正在工作线程中执行时无法关闭，先等待预取的片段完成
+        if pending is not None:
+            try:
+                await pending
+            except BaseException:
+                pass
+        if generator is not None:
+            generator.close()
 
 # API路由
 @app.get("/", response_model=dict)
@@ -206,72 +440,54 @@ async def root():
 async def get_voices():
     """获取可用语音列表"""
     try:
-        voices = list_available_voices()
-        voice_info_list = []
-        
-        for voice in voices:
-            # 解析语音名称格式
-            parts = voice.split('_')
-            if len(parts) >= 2:
-                lang_code = parts[0][0]  # 第一个字母
-                gender = parts[0][1]     # 第二个字母
-                
-                language_map = {
-                    'a': 'American English',
-                    'b': 'British English',
-                    'j': 'Japanese',
-                    'z': 'Mandarin Chinese',
-                    'e': 'Spanish',
-                    'f': 'French',
-                    'h': 'Hindi',
-                    'i': 'Italian',
-                    'p': 'Brazilian Portuguese'
-                }
-                
-                gender_map = {'f': 'Female', 'm': 'Male'}
-                
-                voice_info = VoiceInfo(
-                    name=voice,
-                    language=language_map.get(lang_code, 'Unknown'),
-                    gender=gender_map.get(gender, 'Unknown')
-                )
-                voice_info_list.append(voice_info)
-        
+        # 列表在启动时（以及语音目录变化时）生成，这里无需扫描目录
+        voice_info_list = getattr(app.state, "voice_info", None)
+        if voice_info_list is None:
+            refresh_voice_set()
+            voice_info_list = app.state.voice_info
         return voice_info_list
     except Exception as e:
         logger.error(f"Error getting voices: {e}")
         raise HTTPException(status_code=500, detail="获取语音列表失败")
 
+@app.post("/voices/refresh")
+async def refresh_voices():
+    """重新扫描语音目录（新增或删除语音文件后调用）"""
+    try:
+        voices = refresh_voice_set()
+        return {"message": "语音列表已刷新", "count": len(voices)}
+    except Exception as e:
+        logger.error(f"Error refreshing voices: {e}")
+        raise HTTPException(status_code=500, detail="刷新语音列表失败")
+
 @app.post("/tts/file")
 async def text_to_speech_file(request: TTSRequest):
     """文本转语音，返回音频文件"""
     # 选择语音
     selected_voice = select_voice_from_request(request)
     
+    # 使用SHA1生成唯一文件名
+    filename = generate_sha1_filename(request.text, selected_voice, request.speed, request.format)
+    headers = {"Content-Disposition": f"attachment; filename={filename}"}
+    
+    # 相同请求直接返回缓存的音频
+    cache_key = AudioCache.make_key(request.text, selected_voice, request.speed, request.sample_rate, request.format, request.volume_gain)
+    media_type = audio_media_type(request.format, request.sample_rate)
+    cached = audio_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type=media_type, headers={**headers, "X-Cache": "HIT"})
+    
     # 生成音频数据
     audio_data = await generate_audio(request.text, selected_voice, request.speed, request.sample_rate, request.volume_gain)
     
-    # 创建临时文件
-    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{request.format}") as tmp_file:
-        tmp_path = Path(tmp_file.name)
-    
     try:
-        # 保存音频到临时文件
-        sf.write(str(tmp_path), audio_data, request.sample_rate, format=request.format)
-        
-        # 使用SHA1生成唯一文件名
-        filename = generate_sha1_filename(request.text, selected_voice, request.speed, request.format)
+        # 在内存中编码音频，无需临时文件
+        content = encode_audio(audio_data, request.sample_rate, request.format)
+        audio_cache.put(cache_key, content)
         
         # 返回文件响应
-        return FileResponse(
-            path=str(tmp_path),
-            media_type=f"audio/{request.format}",
-            filename=filename,
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
+        return Response(content=content, media_type=media_type, headers={**headers, "X-Cache": "MISS"})
     except Exception as e:
-        if tmp_path.exists():
-            tmp_path.unlink()
         logger.error(f"Error saving audio file: {e}")
         raise HTTPException(status_code=500, detail="保存音频文件失败")
 
@@ -281,23 +497,40 @@ async def text_to_speech_data(request: TTSRequest):
     # 选择语音
     selected_voice = select_voice_from_request(request)
     
-    # 生成音频数据
+    # 使用SHA1生成唯一文件名
+    filename = generate_sha1_filename(request.text, selected_voice, request.speed, request.format)
+    headers = {"Content-Disposition": f"inline; filename={filename}"}
+    
+    # 相同请求直接返回缓存的音频
+    cache_key = AudioCache.make_key(request.text, selected_voice, request.speed, request.sample_rate, request.format, request.volume_gain)
+    media_type = audio_media_type(request.format, request.sample_rate)
+    cached = audio_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type=media_type, headers={**headers, "X-Cache": "HIT"})
+    
+    # WAV和原始PCM边生成边输出，首段合成完成即可开始返回数据
+    if request.format in ('wav', 'pcm'):
+        model_instance = await get_model()
+        return StreamingResponse(
+            audio_chunk_iter(model_instance, request.text, selected_voice, request.speed, request.sample_rate, request.volume_gain,
+                             cache_key=cache_key, wav_header=request.format == 'wav'),
+            media_type=media_type,
+            headers={**headers, "X-Cache": "MISS"}
+        )
+    
+    # 其他格式需要完整音频才能编码
     audio_data = await generate_audio(request.text, selected_voice, request.speed, request.sample_rate, request.volume_gain)
     
     try:
         # 将音频数据写入内存缓冲区
-        buffer = io.BytesIO()
-        sf.write(buffer, audio_data, request.sample_rate, format=request.format)
-        buffer.seek(0)
-        
-        # 使用SHA1生成唯一文件名
-        filename = generate_sha1_filename(request.text, selected_voice, request.speed, request.format)
+        content = encode_audio(audio_data, request.sample_rate, request.format)
+        audio_cache.put(cache_key, content)
         
         # 返回流响应
         return StreamingResponse(
-            buffer,
-            media_type=f"audio/{request.format}",
-            headers={"Content-Disposition": f"inline; filename={filename}"}
+            io.BytesIO(content),
+            media_type=media_type,
+            headers={**headers, "X-Cache": "MISS"}
         )
     except Exception as e:
         logger.error(f"Error generating audio stream: {e}")
@@ -317,7 +550,10 @@ async def text_to_speech_save(request: TTSRequest, output_path: str):
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
         # 保存音频文件
-        sf.write(str(output_file), audio_data, request.sample_rate, format=request.format)
+        if request.format == 'pcm':
+            output_file.write_bytes(encode_audio(audio_data, request.sample_rate, request.format))
+        else:
+            sf.write(str(output_file), audio_data, request.sample_rate, format=request.format)
         
         return {
             "message": "音频文件已保存",
@@ -347,7 +583,7 @@ class FilenameRequest(BaseModel):
 
     @field_validator('format')
     def validate_format(cls, v):
-        supported_formats = {'wav', 'flac', 'ogg', 'mp3', 'aiff', 'au', 'caf', 'w64'}
+        supported_formats = {'wav', 'flac', 'ogg', 'mp3', 'aiff', 'au', 'caf', 'w64', 'pcm'}
         if v.lower() not in supported_formats:
             raise ValueError(f'不支持的音频格式: {v}。支持的格式: {", ".join(supported_formats)}')
         return v.lower()
@@ -372,10 +608,15 @@ async def get_filename(request: FilenameRequest):
 
 
 if __name__ == "__main__":
+    # 安装uvicorn[standard]后使用uvloop事件循环和httptools解析器，否则回退到asyncio和h11
+    # 保持单进程：多个worker会各自加载一份模型、语音和音频缓存
     uvicorn.run(
         "tts_api:app",
         host="0.0.0.0",
         port=8000,
         reload=False,
+        loop="auto",
+        http="auto",
+        workers=1,
         log_level="info"
     )
\ No newline at end of file
@@ -1,13 +1,35 @@
+import os
+import psutil
+
+# Size OpenMP/BLAS thread pools before torch and numpy are imported. One thread per
+# physical core: hyperthread siblings share the FPUs, and one thread per logical core
+# oversubscribes the pools. Export a variable to override.
+_CPU_THREADS = str(max(1, psutil.cpu_count(logical=False) or 1))
+for _var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "NUMEXPR_NUM_THREADS"):
+    os.environ.setdefault(_var, _CPU_THREADS)
+
 import torch
+
+def _torch_threads() -> int:
+    """Intra-op thread count from OMP_NUM_THREADS, which may be a nested list like "4,1" or empty"""
+    try:
+        return max(1, int(os.environ["OMP_NUM_THREADS"].split(",")[0]))
+    except ValueError:
+        return int(_CPU_THREADS)
+
+# Intra-op parallelism does the work; a single inter-op thread avoids a second pool
+torch.set_num_threads(_torch_threads())
+torch.set_num_interop_threads(1)
 from typing import Optional, Tuple, List, Union
-from models import build_model, generate_speech, list_available_voices
+from models import build_model, generate_speech, list_available_voices, audio_to_tensor, SPLIT_PATTERN, VOICES_DIR
 from tqdm.auto import tqdm
 import soundfile as sf
 from pathlib import Path
 import numpy as np
 import time
-import os
 import sys
+import struct
+from collections import OrderedDict
 
 # Define path type for consistent handling
 PathLike = Union[str, Path]
@@ -22,6 +44,8 @@ MAX_SPEED = 3.0
 DEFAULT_SPEED = 1.0
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds
+PHONEME_CACHE_SIZE = 32  # texts whose phonemes are kept for regeneration
+CUDA_CACHE_FLUSH_BYTES = 2 * 1024**3  # release cached VRAM between runs above this
 
 # Constants with validation
 def validate_sample_rate(rate: int) -> int:
@@ -49,6 +73,13 @@ DEFAULT_MODEL_PATH = Path('kokoro-v1_0.pth').resolve()
 DEFAULT_OUTPUT_FILE = Path('output.wav').resolve()
 DEFAULT_LANGUAGE = validate_language('a')  # 'a' for American English, 'b' for British English
 DEFAULT_TEXT = "Hello, welcome to this text-to-speech test."
+# Full precision by default; KOKORO_DTYPE=auto runs CUDA inference under bf16
+# (fp16 on older GPUs) autocast and still stays fp32 on CPU
+DEFAULT_DTYPE = os.environ.get("KOKORO_DTYPE", "fp32")
+# Set KOKORO_SCRIPT=1 to TorchScript the vocoder when running on CPU
+SCRIPT_DECODER = os.environ.get("KOKORO_SCRIPT") == "1"
+# Set KOKORO_COMPILE=1 to torch.compile the model when running on CUDA
+COMPILE_MODEL = os.environ.get("KOKORO_COMPILE") == "1"
 
 # Ensure output directory exists
 DEFAULT_OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
@@ -103,12 +134,32 @@ def get_speed() -> float:
         except ValueError:
             print("Please enter a valid number.")
 
-def save_audio_with_retry(audio_data: np.ndarray, sample_rate: int, output_path: PathLike, max_retries: int = MAX_RETRIES, retry_delay: float = RETRY_DELAY) -> bool:
+def _write_wav_fast(path: Path, segments: List[np.ndarray], sample_rate: int) -> None:
+    """Write mono float32 segments back to back as a 16-bit PCM WAV with a hand-built header"""
+    # The header needs the total size, which is known without joining the segments
+    nbytes = 2 * sum(len(segment) for segment in segments)
+    header = struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + nbytes, b'WAVE',
+        b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b'data', nbytes
+    )
+    with open(path, 'wb') as f:
+        f.write(header)
+        for segment in segments:
+            # Scale, clip and round in one float32 buffer per segment; the caller's arrays are left untouched
+            pcm = np.multiply(segment, 32767, dtype=np.float32)
+            np.clip(pcm, -32767, 32767, out=pcm)
+            np.rint(pcm, out=pcm)
+            pcm.astype('<i2').tofile(f)
+
+def save_audio_with_retry(audio_data: Union[np.ndarray, List[np.ndarray]], sample_rate: int, output_path: PathLike, max_retries: int = MAX_RETRIES, retry_delay: float = RETRY_DELAY) -> bool:
     """
     Attempt to save audio data to file with retry logic.
 
     Args:
-        audio_data: Audio data as numpy array
+        audio_data: Audio data as numpy array, or a list of mono segments that are
+            written back to back without being joined in memory first
         sample_rate: Sample rate in Hz
         output_path: Path to save the audio file
         max_retries: Maximum number of retry attempts
@@ -132,10 +183,12 @@ def save_audio_with_retry(audio_data: np.ndarray, sample_rate: int, output_path:
         print(f"Warning: Could not remove existing file: {e}")
         print("This might indicate the file is in use by another program.")
 
+    segments = [audio_data] if isinstance(audio_data, np.ndarray) else audio_data
+
     for attempt in range(max_retries):
         try:
             # Validate audio data before saving
-            if audio_data is None or len(audio_data) == 0:
+            if segments is None or sum(len(segment) for segment in segments) == 0:
                 raise ValueError("Empty audio data")
 
             # Check write permissions for the directory
@@ -147,7 +200,16 @@ def save_audio_with_retry(audio_data: np.ndarray, sample_rate: int, output_path:
 
             # Save audio file to temporary location
             print(f"Saving audio to temporary file: {temp_path}")
-            sf.write(str(temp_path), audio_data, sample_rate)
+            if temp_path.suffix.lower() == '.wav' and all(s.dtype == np.float32 and s.ndim == 1 for s in segments):
+                # Common case: mono float32 WAV, no need to go through libsndfile
+                _write_wav_fast(temp_path, segments, sample_rate)
+            elif len(segments) == 1:
+                sf.write(str(temp_path), segments[0], sample_rate)
+            else:
+                # Stream the segments through one open file instead of joining them
+                with sf.SoundFile(str(temp_path), mode='w', samplerate=sample_rate, channels=1) as snd:
+                    for segment in segments:
+                        snd.write(segment)
 
             # If successful, rename to final location
             if temp_path.exists():
@@ -191,7 +253,6 @@ def save_audio_with_retry(audio_data: np.ndarray, sample_rate: int, output_path:
     return False
 
 def main() -> None:
-    import psutil
     import gc
     
     try:
@@ -218,12 +279,16 @@ def main() -> None:
         # Build model
         print("\nInitializing model...")
         with tqdm(total=1, desc="Building model") as pbar:
-            model = build_model(DEFAULT_MODEL_PATH, device)
+            model = build_model(DEFAULT_MODEL_PATH, device, dtype=DEFAULT_DTYPE,
+                                compile_model=COMPILE_MODEL, script_decoder=SCRIPT_DECODER)
             pbar.update(1)
 
         # Cache for voices to avoid redundant calls
         voices_cache = None
 
+        # Phonemes per text, so regenerating the same text at another speed or voice skips G2P
+        phoneme_cache = OrderedDict()
+
         while True:
             choice = print_menu()
 
@@ -272,7 +337,7 @@ def main() -> None:
                 # Generate speech
                 all_audio = []
                 # Use Path object for consistent path handling
-                voice_path = Path("voices").resolve() / f"{voice}.pt"
+                voice_path = VOICES_DIR / f"{voice}.pt"
 
                 # Verify voice file exists
                 if not voice_path.exists():
@@ -302,7 +367,17 @@ def main() -> None:
 
                     # Initialize generator
                     try:
-                        generator = model(text, voice=voice_path, speed=speed, split_pattern=r'\n+')
+                        cached_phonemes = phoneme_cache.get(text)
+                        if cached_phonemes is not None and hasattr(model, 'generate_from_tokens'):
+                            phoneme_cache.move_to_end(text)
+                            generator = (
+                                result
+                                for ps in cached_phonemes
+                                for result in model.generate_from_tokens(ps, voice=voice_path, speed=speed)
+                            )
+                        else:
+                            cached_phonemes = None
+                            generator = model(text, voice=voice_path, speed=speed, split_pattern=SPLIT_PATTERN)
                     except (ValueError, TypeError, RuntimeError) as e:
                         print(f"Error initializing speech generator: {e}")
                         watchdog.cancel()
@@ -313,6 +388,7 @@ def main() -> None:
                         continue
 
                     # Process segments
+                    segment_phonemes = []
                     with tqdm(desc="Generating speech") as pbar:
                         for gs, ps, audio in generator:
                             # Check overall timeout
@@ -333,13 +409,20 @@ def main() -> None:
                             # Process audio if available
                             if audio is not None:
                                 # Only convert if it's a numpy array, not if already tensor
-                                audio_tensor = audio if isinstance(audio, torch.Tensor) else torch.from_numpy(audio).float()
+                                audio_tensor = audio_to_tensor(audio)
 
                                 all_audio.append(audio_tensor)
+                                segment_phonemes.append(ps)
                                 print(f"\nGenerated segment: {gs}")
                                 if ps:  # Only print phonemes if available
                                     print(f"Phonemes: {ps}")
                                 pbar.update(1)
+                        else:
+                            # Only a full run is cached; a run cut short by a timeout would drop segments
+                            if cached_phonemes is None and segment_phonemes and all(segment_phonemes):
+                                phoneme_cache[text] = tuple(segment_phonemes)
+                                if len(phoneme_cache) > PHONEME_CACHE_SIZE:
+                                    phoneme_cache.popitem(last=False)
 
                     # Mark generation as complete (for watchdog)
                     generation_complete = True
@@ -365,19 +448,12 @@ def main() -> None:
                 # Save audio
                 if all_audio:
                     try:
-                        # Handle single segment case without concatenation
-                        if len(all_audio) == 1:
-                            final_audio = all_audio[0]
-                        else:
-                            try:
-                                final_audio = torch.cat(all_audio, dim=0)
-                            except RuntimeError as e:
-                                print(f"Error concatenating audio segments: {e}")
-                                continue
+                        # Segments are written one after another, so the utterance is never joined in memory
+                        segments = [segment.numpy() for segment in all_audio]
 
                         # Use consistent Path object
                         output_path = DEFAULT_OUTPUT_FILE
-                        if save_audio_with_retry(final_audio.numpy(), SAMPLE_RATE, output_path):
+                        if save_audio_with_retry(segments, SAMPLE_RATE, output_path):
                             print(f"\nAudio saved to {output_path}")
                             # Play a system beep to indicate completion
                             try:
@@ -391,6 +467,11 @@ def main() -> None:
                 else:
                     print("Error: Failed to generate audio")
 
+                # Hand cached VRAM back between runs only when the allocator is holding a lot of it
+                all_audio = None
+                if device == 'cuda' and torch.cuda.memory_reserved() > CUDA_CACHE_FLUSH_BYTES:
+                    torch.cuda.empty_cache()
+
             elif choice == "3":
                 print("\nGoodbye!")
                 break
@@ -447,15 +528,8 @@ def main() -> None:
                 except Exception as cache_error:
                     print(f"Error clearing voice cache: {cache_error}")
 
-            # Clean up any CUDA resources
-            if torch.cuda.is_available():
-                try:
-                    print("Cleaning up CUDA resources...")
-                    torch.cuda.empty_cache()
-                    print("CUDA cache emptied")
-                except Exception as cuda_error:
-                    print(f"Error clearing CUDA cache: {cuda_error}")
-
+            # No torch.cuda.empty_cache() here: it blocks on the device and the
+            # driver reclaims all VRAM when the process exits anyway
 
             # Final garbage collection
             try:
@@ -10,13 +10,70 @@ from pydub import AudioSegment
 from pathlib import Path
 import tempfile
 import io
+import math
+import functools
+import threading
+
+try:
+    from numba import njit  # 可选依赖：编译融合的增益+裁剪内核
+except ImportError:
+    njit = None
+
+# 采样宽度(字节) -> (整数类型, 转为[-1, 1]时的除数, 转回整数时的乘数)
+_SAMPLE_FORMATS = {
+    1: (np.int8, 128.0, 127),
+    2: (np.int16, 32768.0, 32767),
+    4: (np.int32, 2147483648.0, 2147483647),
+}
+
+@functools.lru_cache(maxsize=64)
+def _db_to_linear(db: float) -> float:
+    """dB转换为线性增益（增益取值有限，结果缓存）"""
+    return 10.0 ** (db / 20.0)
+
+def _is_unity(gain: float) -> bool:
+    """增益是否等同于不处理"""
+    return abs(gain - 1.0) < 1e-6
+
+if njit is not None:
+    # 单线程内核：API会从多个线程同时调用，parallel=True在numba的workqueue线程层下并发启动会使进程中止；
+    # 且每段音频只有数万个采样，线程池的分发开销大于收益
+    @njit(fastmath=True, cache=True)
+    def _gain_clip(x, gain, lo, hi, out):
+        """一次遍历完成增益、裁剪和类型转换（按输入/输出类型分别编译）"""
+        for i in range(x.size):
+            v = x[i] * gain
+            if v < lo:
+                v = lo
+            elif v > hi:
+                v = hi
+            out[i] = v
+
+    # 导入时编译常用的类型组合（float32音频、int16 PCM），避免首个请求在事件循环中等待JIT编译
+    try:
+        _gain_clip(np.zeros(1, np.float32), np.float32(1.0), -1.0, 1.0, np.empty(1, np.float32))
+        _gain_clip(np.zeros(1, np.int16), 1.0, -32768.0, 32767.0, np.empty(1, np.int16))
+    except Exception:
+        _gain_clip = None
+else:
+    _gain_clip = None
 
 class VolumeEnhancer:
     """音频音量增强器"""
     
     def __init__(self):
         """初始化音量增强器"""
-        pass
+        # 每个线程一个可复用的float32临时缓冲区（API会在多个工作线程中并发调用）
+        self._local = threading.local()
+    
+    def _scratch(self, shape) -> np.ndarray:
+        """返回指定形状的float32临时缓冲区视图，仅在容量不足时重新分配"""
+        n = math.prod(shape)
+        buf = getattr(self._local, 'scratch', None)
+        if buf is None or buf.size < n:
+            buf = np.empty(n, dtype=np.float32)
+            self._local.scratch = buf
+        return buf[:n].reshape(shape)
     
     def enhance_volume_file(self, input_file: str, output_file: str, volume_gain: float = 6.0) -> bool:
         """
@@ -31,40 +88,46 @@ class VolumeEnhancer:
             bool: 是否成功
         """
         try:
-            # 加载音频文件
+            linear_gain = _db_to_linear(volume_gain)
+            
+            # WAV/FLAC直接用soundfile读写，省去pydub的格式转换和多次复制
+            if Path(input_file).suffix.lower() in ('.wav', '.flac'):
+                info = sf.info(input_file)
+                data, sample_rate = sf.read(input_file, dtype='float32')
+                if not _is_unity(linear_gain):
+                    data *= np.float32(linear_gain)
+                    np.clip(data, -1.0, 1.0, out=data)
+                # 保持原始采样格式，WAV不支持时退回16位PCM
+                subtype = info.subtype if sf.check_format('WAV', info.subtype) else 'PCM_16'
+                sf.write(output_file, data, sample_rate, format='WAV', subtype=subtype)
+                return True
+            
+            # 其他格式通过pydub(ffmpeg)解码
             audio = AudioSegment.from_file(input_file)
             
-            # 转换为numpy数组
-            samples = np.array(audio.get_array_of_samples())
-            
-            # 根据采样宽度调整
-            if audio.sample_width == 2:
-                # int16 -> float32
-                samples = samples.astype(np.float32) / 32768.0
-            elif audio.sample_width == 4:
-                # int32 -> float32
-                samples = samples.astype(np.float32) / 2147483648.0
-            elif audio.sample_width == 1:
-                # int8 -> float32
-                samples = samples.astype(np.float32) / 128.0
-            
-            # 应用线性增益
-            linear_gain = 10 ** (volume_gain / 20.0)
-            enhanced_samples = samples * linear_gain
-            
-            # 限制范围
-            enhanced_samples = np.clip(enhanced_samples, -1.0, 1.0)
-            
-            # 转换回原始格式
-            if audio.sample_width == 2:
-                enhanced_samples = (enhanced_samples * 32767).astype(np.int16)
-            elif audio.sample_width == 4:
-                enhanced_samples = (enhanced_samples * 2147483647).astype(np.int32)
-            elif audio.sample_width == 1:
-                enhanced_samples = (enhanced_samples * 127).astype(np.int8)
+            # 0dB增益只需转换格式
+            if _is_unity(linear_gain):
+                audio.export(output_file, format="wav")
+                return True
+            
+            if audio.sample_width not in _SAMPLE_FORMATS:
+                raise ValueError(f"不支持的采样宽度: {audio.sample_width}")
+            dtype, in_scale, out_scale = _SAMPLE_FORMATS[audio.sample_width]
+            
+            # 直接以原始数据构造numpy视图，不经过array转换
+            samples = np.frombuffer(audio.raw_data, dtype=dtype)
+            
+            # 归一化与线性增益合并为一次乘法，写入预分配的float32缓冲区
+            buf = np.empty(samples.shape, dtype=np.float32)
+            np.multiply(samples, np.float32(linear_gain / in_scale), out=buf, casting='unsafe')
+            
+            # 限制范围并缩放回整数范围，均为原地操作
+            np.clip(buf, -1.0, 1.0, out=buf)
+            buf *= out_scale
+            enhanced_samples = buf.astype(dtype)
             
             # 创建新的AudioSegment
-            enhanced_audio = audio._spawn(enhanced_samples)
+            enhanced_audio = audio._spawn(enhanced_samples.tobytes())
             
             # 导出增强后的音频
             enhanced_audio.export(output_file, format="wav")
@@ -88,29 +151,49 @@ class VolumeEnhancer:
             np.ndarray: 增强后的音频数据
         """
         try:
-            # 将dB转换为线性增益
-            linear_gain = 10 ** (volume_gain / 20.0)
+            # 将dB转换为线性增益，0dB时直接返回原数据
+            linear_gain = _db_to_linear(volume_gain)
+            if _is_unity(linear_gain):
+                return audio_data
             
-            # 直接应用线性增益到音频数据
-            enhanced_data = audio_data * linear_gain
-            
-            # 防止削波：限制在有效范围内
+            # 防止削波：确定有效范围
             if audio_data.dtype == np.float32:
-                # float32范围通常是[-1.0, 1.0]
-                enhanced_data = np.clip(enhanced_data, -1.0, 1.0)
+                # float32范围通常是[-1.0, 1.0]，边界与增益都用float32标量，避免提升为float64计算
+                min_val, max_val = np.float32(-1.0), np.float32(1.0)
+                linear_gain = np.float32(linear_gain)
             elif audio_data.dtype == np.int16:
                 # int16范围是[-32768, 32767]
-                enhanced_data = np.clip(enhanced_data, -32768, 32767)
+                min_val, max_val = -32768, 32767
             elif audio_data.dtype == np.int32:
                 # int32范围是[-2147483648, 2147483647]
-                enhanced_data = np.clip(enhanced_data, -2147483648, 2147483647)
+                min_val, max_val = -2147483648, 2147483647
             else:
                 # 其他类型，使用原始范围
                 max_val = np.iinfo(audio_data.dtype).max if np.issubdtype(audio_data.dtype, np.integer) else 1.0
                 min_val = np.iinfo(audio_data.dtype).min if np.issubdtype(audio_data.dtype, np.integer) else -1.0
-                enhanced_data = np.clip(enhanced_data, min_val, max_val)
             
-            return enhanced_data.astype(audio_data.dtype)
+            if _gain_clip is not None:
+                # 已安装numba：单次遍历直接写入与输入同类型的输出数组
+                enhanced_data = np.empty(audio_data.shape, dtype=audio_data.dtype)
+                _gain_clip(np.ascontiguousarray(audio_data).ravel(), linear_gain,
+                           float(min_val), float(max_val), enhanced_data.ravel())
+                return enhanced_data
+            
+            if np.issubdtype(audio_data.dtype, np.integer) and audio_data.dtype.itemsize <= 2:
+                # 整数输入在复用的float32缓冲区中计算，最后的类型转换会生成独立的结果数组
+                buf = self._scratch(audio_data.shape)
+                np.multiply(audio_data, np.float32(linear_gain), out=buf, casting='unsafe')
+                np.clip(buf, np.float32(min_val), np.float32(max_val), out=buf)
+                return buf.astype(audio_data.dtype)
+            
+            # 直接应用线性增益到音频数据（结果会被调用方保留，因此不能使用临时缓冲区）
+            enhanced_data = audio_data * linear_gain
+            
+            # 限制在有效范围内（enhanced_data是新数组，可以原地裁剪）
+            np.clip(enhanced_data, min_val, max_val, out=enhanced_data)
+            
+            # float32输入时类型已一致，不再复制
+            return enhanced_data.astype(audio_data.dtype, copy=False)
             
         except Exception as e:
             print(f"音频数据音量增强失败: {e}")
@@ -128,34 +211,43 @@ class VolumeEnhancer:
             np.ndarray: 标准化后的音频数据
         """
         try:
-            # 计算当前音频的RMS值
+            if audio_data.size == 0:
+                return audio_data
+            
+            # 计算当前音频的RMS值（einsum直接求平方和，不生成平方后的临时数组）
             if audio_data.dtype == np.float32:
                 # float32音频数据
-                current_rms = np.sqrt(np.mean(audio_data ** 2))
+                flat = audio_data.ravel()
+                current_rms = math.sqrt(np.einsum('i,i->', flat, flat) / flat.size)
                 # 计算目标RMS值（-3dB对应约0.707）
-                target_rms = 10 ** (target_db / 20.0)
+                target_rms = _db_to_linear(target_db)
                 
-                if current_rms > 0:
+                if current_rms > 0 and abs(current_rms - target_rms) >= 1e-3 * target_rms:
                     gain_factor = target_rms / current_rms
-                    normalized_data = audio_data * gain_factor
-                    # 限制在有效范围内
-                    normalized_data = np.clip(normalized_data, -1.0, 1.0)
+                    normalized_data = audio_data * np.float32(gain_factor)
+                    # 限制在有效范围内（原地裁剪）
+                    np.clip(normalized_data, -1.0, 1.0, out=normalized_data)
                 else:
+                    # 静音或已处于目标音量，跳过整段处理
                     normalized_data = audio_data
                     
             else:
-                # 整数类型音频数据
+                # 整数类型音频数据：在复用的float32缓冲区中原地完成所有运算
                 max_val = np.iinfo(audio_data.dtype).max
-                audio_float = audio_data.astype(np.float32) / max_val
-                current_rms = np.sqrt(np.mean(audio_float ** 2))
-                target_rms = 10 ** (target_db / 20.0)
+                audio_float = self._scratch(audio_data.shape)
+                np.multiply(audio_data, np.float32(1.0 / max_val), out=audio_float, casting='unsafe')
+                flat = audio_float.ravel()
+                current_rms = math.sqrt(np.einsum('i,i->', flat, flat) / flat.size)
+                target_rms = _db_to_linear(target_db)
                 
-                if current_rms > 0:
+                if current_rms > 0 and abs(current_rms - target_rms) >= 1e-3 * target_rms:
                     gain_factor = target_rms / current_rms
-                    normalized_float = audio_float * gain_factor
-                    normalized_float = np.clip(normalized_float, -1.0, 1.0)
-                    normalized_data = (normalized_float * max_val).astype(audio_data.dtype)
+                    audio_float *= np.float32(gain_factor)
+                    np.clip(audio_float, -1.0, 1.0, out=audio_float)
+                    audio_float *= max_val
+                    normalized_data = audio_float.astype(audio_data.dtype)
                 else:
+                    # 静音或已处于目标音量，跳过整段处理
                     normalized_data = audio_data
             
             return normalized_data